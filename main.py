@@ -1048,6 +1048,9 @@ class MainWindow(QMainWindow):
         if dashboard_index >= 0:
             widget = self.content_stack.widget(dashboard_index)
             self.content_stack.removeWidget(widget)
+            if isinstance(widget, RedesignedHomePage):
+                # Its worker threads must stop before the widget is deleted
+                widget.shutdown()
             widget.deleteLater()
         
         # Create new dashboard
@@ -8,6 +8,7 @@ from typing import List, Dict, Optional, Any
 logger = logging.getLogger(__name__)
 
 from .scraper import HKJCResultsScraper
+from .racecourse_codes import add_racecourse_code_columns
 
 class HKJCDataPipeline:
     """Pipeline for managing HKJC data scraping and database storage."""
@@ -72,6 +73,9 @@ class HKJCDataPipeline:
         # 2. Migration: Check for missing columns in existing tables
         self._migrate_schema(cursor)
         
+        # 3. Normalized racecourse_code used by the home page race lookups
+        add_racecourse_code_columns(cursor)
+        
         conn.commit()
         conn.close()
 
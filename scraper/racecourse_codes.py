@@ -0,0 +1,60 @@
+"""
+Normalized racecourse codes for the free-form ``racecourse`` column.
+
+Kept free of scraping dependencies so UI modules can import it cheaply.
+"""
+
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# Racecourse spellings found in the data, per course code
+COURSE_ALIASES = {
+    'ST': ('ST', 'Sha Tin', '沙田'),
+    'HV': ('HV', 'Happy Valley', '跑馬地'),
+}
+
+# 'ST'/'HV' derived from texts like 'ST (草地)', 'Sha Tin' or 'HV'.
+# Substring matches are required because of suffixes like '(草地)'.
+RACECOURSE_CODE_EXPR = "CASE {} END".format(" ".join(
+    "WHEN {} THEN '{}'".format(
+        " OR ".join(f"racecourse LIKE '%{alias}%'" for alias in aliases), code
+    )
+    for code, aliases in COURSE_ALIASES.items()
+))
+
+# Tables that carry the generated racecourse_code column
+RACECOURSE_CODE_TABLES = ("future_race_cards", "fixtures")
+
+
+def add_racecourse_code_columns(cursor: sqlite3.Cursor):
+    """Add racecourse_code as a VIRTUAL generated column where it is missing.
+
+    Generated columns need SQLite 3.31+; on failure the table is left as is
+    and readers fall back to RACECOURSE_CODE_EXPR.
+    """
+    for table in RACECOURSE_CODE_TABLES:
+        try:
+            if table in coded_tables(cursor.connection):
+                continue
+            cursor.execute(f"""
+                ALTER TABLE {table} ADD COLUMN racecourse_code TEXT
+                GENERATED ALWAYS AS ({RACECOURSE_CODE_EXPR}) VIRTUAL
+            """)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not add racecourse_code to {table}: {e}")
+
+
+def coded_tables(conn: sqlite3.Connection) -> frozenset:
+    """Names of the RACECOURSE_CODE_TABLES that already have racecourse_code"""
+    tables = set()
+    for table in RACECOURSE_CODE_TABLES:
+        try:
+            # table_xinfo (unlike table_info) also lists generated columns
+            columns = {row[1] for row in conn.execute(f"PRAGMA table_xinfo({table})")}
+        except sqlite3.Error:
+            continue
+        if 'racecourse_code' in columns:
+            tables.add(table)
+    return frozenset(tables)
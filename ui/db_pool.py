@@ -0,0 +1,98 @@
+"""
+Shared SQLite connections for UI worker threads.
+
+Workers borrow a connection with ``with acquire(db_path) as conn:`` instead
+of opening and closing their own on every run.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Roughly the number of UI workers that can query at the same time
+POOL_SIZE = 4
+
+# Race card entries and odds the predictor reads for a race; a change here
+# invalidates cached predictions
+_RACE_FINGERPRINT_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM future_race_cards
+         WHERE DATE(race_date) = ? AND race_number = ? AND racecourse = ?),
+        (SELECT MAX(scraped_at) FROM future_race_cards
+         WHERE DATE(race_date) = ? AND race_number = ? AND racecourse = ?),
+        (SELECT COUNT(*) FROM odds_live
+         WHERE race_date = ? AND race_number = ? AND racecourse = ?),
+        (SELECT MAX(scraped_at) FROM odds_live
+         WHERE race_date = ? AND race_number = ? AND racecourse = ?),
+        (SELECT COUNT(*) FROM odds_history
+         WHERE race_date = ? AND race_number = ? AND racecourse = ?),
+        (SELECT MAX(scraped_at) FROM odds_history
+         WHERE race_date = ? AND race_number = ? AND racecourse = ?)
+"""
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a read-oriented connection that any pool thread may use"""
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA cache_size = -20000")
+    return conn
+
+
+class ConnectionPool:
+    """Bounded set of reusable connections to one database"""
+
+    def __init__(self, db_path: str, size: int = POOL_SIZE):
+        self.db_path = db_path
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection, opening one only when none is idle"""
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = _connect(self.db_path)
+            try:
+                yield conn
+            finally:
+                self._idle.put_nowait(conn)
+        finally:
+            self._slots.release()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    """Return the pool for a database, creating it on first use"""
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = _pools[db_path] = ConnectionPool(db_path)
+        return pool
+
+
+def acquire(db_path: str):
+    """Borrow a pooled connection to ``db_path`` for a ``with`` block"""
+    return get_pool(db_path).acquire()
+
+
+def race_fingerprint(conn: sqlite3.Connection, race_date: str, race_number: int,
+                     racecourse: str) -> tuple:
+    """Row counts and latest scrape times of a race's card and odds, for cache keys.
+    
+    Only catches changes written under this exact racecourse spelling, so
+    caches keyed on it should still expire entries after a while.
+    """
+    race_args = (str(race_date).split(' ')[0], race_number, racecourse)
+    return tuple(conn.execute(_RACE_FINGERPRINT_SQL, race_args * 6).fetchone())
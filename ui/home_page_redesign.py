@@ -14,15 +14,22 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QComboBox,
     QPushButton, QTableWidget, QTableWidgetItem, QScrollArea, 
     QGridLayout, QProgressBar, QTabWidget, QGroupBox, QDateEdit,
-    QTextEdit, QSpacerItem, QSizePolicy
+    QTextEdit, QSpacerItem, QSizePolicy, QHeaderView, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QDate, QTimer, QThread
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QDate, QTimer, QThread, QObject, QEvent
 from PyQt5.QtGui import QFont, QColor, QPalette
 import sqlite3
 import os
-from datetime import datetime, timedelta
+import logging
+from datetime import date, datetime, timedelta
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+from scraper.racecourse_codes import COURSE_ALIASES, RACECOURSE_CODE_EXPR, coded_tables
+
+logger = logging.getLogger(__name__)
+
 # Dark theme colors matching main.py
 DARK_COLORS = {
     'background_primary': '#0d1117',
@@ -38,6 +45,397 @@ DARK_COLORS = {
     'border_light': '#30363d',
 }
 
+# Single stylesheet for the whole home page, applied once at the root.
+# Widgets opt in via setObjectName so Qt resolves one shared rule set
+# instead of parsing a separate inline stylesheet per widget instance.
+_GLOBAL_DARK_QSS = """
+QFrame#predictionCard {{
+    background-color: {background_primary};
+    border: 1px solid {border_light};
+    border-radius: 8px;
+    padding: 8px;
+}}
+QFrame#predictionCard:hover {{
+    border-color: {accent_primary};
+    background-color: {background_secondary};
+}}
+QFrame#raceCard {{
+    background-color: {background_primary};
+    border: 1px solid {border_light};
+    border-radius: 12px;
+    padding: 16px;
+}}
+QFrame#panelFrame {{
+    background-color: {background_primary};
+    border: 1px solid {border_light};
+    border-radius: 8px;
+    padding: 0;
+}}
+QFrame#controlPanel {{
+    background-color: {background_secondary};
+    border: 1px solid {border_light};
+    border-radius: 8px;
+}}
+QLabel#primaryText {{ color: {text_primary}; }}
+QLabel#secondaryText {{ color: {text_secondary}; }}
+QLabel#mutedText {{ color: {text_muted}; }}
+QLabel#accentText {{ color: {accent_primary}; }}
+QLabel#successText {{ color: {accent_success}; }}
+QLabel#warningText {{ color: {accent_warning}; }}
+QLabel#errorText {{ color: {accent_error}; }}
+QLabel#roiPositive {{ color: #10b981; }}
+QLabel#roiNegative {{ color: #ef4444; }}
+QLabel#rankGold {{ color: #FFD700; background-color: transparent; }}
+QLabel#rankSilver {{ color: #C0C0C0; background-color: transparent; }}
+QLabel#rankDefault {{ color: {text_secondary}; background-color: transparent; }}
+QProgressBar#probBar {{
+    background-color: {background_secondary};
+    border: none;
+    border-radius: 3px;
+}}
+QProgressBar#probBar::chunk {{
+    background-color: {accent_success};
+    border-radius: 3px;
+}}
+QComboBox#darkCombo {{
+    background-color: {background_primary};
+    color: {text_primary};
+    border: 1px solid {border_light};
+    border-radius: 4px;
+    padding: 4px 8px;
+    font-size: 11px;
+}}
+QPushButton#viewDetailsBtn, QPushButton#smallRefreshBtn, QPushButton#refreshBtn {{
+    background-color: #1a73e8;
+    color: white;
+    border: none;
+    border-radius: 4px;
+}}
+QPushButton#viewDetailsBtn {{ padding: 6px 12px; font-size: 11px; }}
+QPushButton#smallRefreshBtn {{ padding: 4px 8px; font-size: 10px; }}
+QPushButton#refreshBtn {{ border-radius: 6px; font-size: 12px; }}
+QPushButton#viewDetailsBtn:hover, QPushButton#smallRefreshBtn:hover,
+QPushButton#refreshBtn:hover {{
+    background-color: #1557b0;
+}}
+QPushButton#predictBtn {{
+    background-color: {accent_success};
+    color: white;
+    border: none;
+    border-radius: 6px;
+    font-size: 12px;
+    font-weight: 600;
+}}
+QPushButton#predictBtn:hover {{ background-color: #059669; }}
+QPushButton#predictBtn:disabled {{ background-color: #475569; }}
+QTableWidget#rankingsTable {{
+    background-color: transparent;
+    border: none;
+    font-size: 10px;
+}}
+QTableWidget#rankingsTable QHeaderView::section {{
+    background-color: {background_secondary};
+    color: {text_primary};
+    padding: 4px;
+    font-weight: 600;
+    font-size: 10px;
+}}
+QWidget#transparentArea {{ background-color: transparent; }}
+QScrollArea#racesScroll, QScrollArea#racesScroll > QWidget {{
+    background-color: transparent;
+    border: none;
+}}
+QWidget#bottomSection {{ background-color: {background_primary}; }}
+""".format(**DARK_COLORS)
+
+# Indexes matching the home page's WHERE/ORDER BY patterns; the DATE(race_date)
+# expression indexes let the date filters seek instead of scanning.
+_HOME_PAGE_INDEXES = (
+    # Superseded by idx_prediction_log_day_race, which the lookup can use
+    "DROP INDEX IF EXISTS idx_prediction_log_date_race",
+    "CREATE INDEX IF NOT EXISTS idx_prediction_log_day_race "
+    "ON prediction_log(DATE(race_date), race_number)",
+    "CREATE INDEX IF NOT EXISTS idx_future_race_cards_date_race "
+    "ON future_race_cards(DATE(race_date), race_number)",
+    "CREATE INDEX IF NOT EXISTS idx_future_race_cards_date_rating "
+    "ON future_race_cards(DATE(race_date), rating DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_future_race_cards_date_code "
+    "ON future_race_cards(DATE(race_date), racecourse_code, race_number)",
+    "CREATE INDEX IF NOT EXISTS idx_fixtures_date "
+    "ON fixtures(DATE(race_date))",
+    "CREATE INDEX IF NOT EXISTS idx_fixtures_date_code "
+    "ON fixtures(DATE(race_date), racecourse_code)",
+)
+
+# Metrics shown when the accuracy summary is unavailable
+_EMPTY_METRICS = {
+    'win_rate': 0, 'place_rate': 0, 'roi': 0, 'avg_odds': 0, 'predictions': 0, 'races': 0
+}
+
+# ROI value label object names by tier (positive / neutral / poor)
+_ROI_OBJECT_NAMES = {1: "roiPositive", 0: "accentText", -1: "roiNegative"}
+
+
+def _set_style_name(widget: QWidget, name: str):
+    """Switch a widget to another global-stylesheet rule and repolish it."""
+    widget.setObjectName(name)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+def _db_mtime(db_path: str) -> float:
+    """Last modification time of the database, including its WAL file.
+    
+    In WAL mode writes land in the -wal file until a checkpoint, so the
+    main file's mtime alone would miss fresh data.
+    """
+    mtime = os.path.getmtime(db_path)
+    wal_path = db_path + '-wal'
+    if os.path.exists(wal_path):
+        mtime = max(mtime, os.path.getmtime(wal_path))
+    return mtime
+
+
+@lru_cache(maxsize=64)
+def _fetch_races(conn: sqlite3.Connection, db_mtime: float, tables: frozenset,
+                 coded: frozenset, race_date: str, course: str) -> Tuple[Tuple, ...]:
+    """Fetch race rows for a date/course.
+    
+    Cached on the database mtime so repeated reloads of an unchanged
+    database skip SQLite entirely. ``tables`` is the set of table names read
+    once at startup and ``coded`` the subset that has the racecourse_code
+    column; the others are filtered on the equivalent expression. Returns
+    immutable rows of
+    (race_number, racecourse, race_distance, race_class, track_going, race_time).
+    """
+    cursor = conn.cursor()
+    try:
+        races = []
+        
+        # Filter on the normalized racecourse code; unknown courses mean all.
+        # The predicate is left out rather than made optional in SQL, so the
+        # (date, racecourse_code) indexes can seek on the code as well
+        def course_filter(table):
+            if course not in COURSE_ALIASES:
+                return "", ()
+            column = 'racecourse_code' if table in coded else f"({RACECOURSE_CODE_EXPR})"
+            return f"AND {column} = ?", (course,)
+        
+        # Try future_race_cards first (most reliable)
+        if 'future_race_cards' in tables:
+            course_sql, course_args = course_filter('future_race_cards')
+            cursor.execute(f"""
+                SELECT DISTINCT race_number, racecourse, race_distance, race_class, track_going, race_time
+                FROM future_race_cards
+                WHERE DATE(race_date) = ?
+                {course_sql}
+                ORDER BY race_number
+            """, (race_date, *course_args))
+            
+            races = [tuple(row) for row in cursor.fetchall()]
+        
+        # If no races, try fixtures table
+        if not races and 'fixtures' in tables:
+            course_sql, course_args = course_filter('fixtures')
+            cursor.execute(f"""
+                SELECT DISTINCT race_date, racecourse, distance as race_distance, race_class, expected_races
+                FROM fixtures 
+                WHERE DATE(race_date) = ?
+                {course_sql}
+            """, (race_date, *course_args))
+            
+            for _date, racecourse, race_distance, race_class, expected_races in cursor.fetchall():
+                # Generate race numbers from 1 to expected_races
+                expected = 8  # Default
+                if expected_races:
+                    try:
+                        expected = int(expected_races)
+                    except (TypeError, ValueError):
+                        pass
+                
+                races.extend(
+                    (race_num, racecourse, race_distance, race_class, 'Unknown', None)
+                    for race_num in range(1, min(expected + 1, 12))
+                )
+        
+        return tuple(races)
+    finally:
+        cursor.close()
+
+
+@lru_cache(maxsize=4)
+def _fetch_dates(conn: sqlite3.Connection, db_mtime: float,
+                 today_iso: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Fetch available race dates and their combo box display strings.
+    
+    Keyed on the database mtime and today's date (the display depends on
+    it), so repeated calls return without touching SQLite.
+    """
+    cursor = conn.cursor()
+    try:
+        # Latest 30 dates from fixtures and from race cards, merged in one
+        # grouped query; has_racecard marks dates with race card data
+        cursor.execute("""
+            SELECT race_date, MAX(has_racecard) AS has_racecard
+            FROM (
+                SELECT * FROM (
+                    SELECT DISTINCT DATE(race_date) AS race_date, 0 AS has_racecard
+                    FROM fixtures
+                    ORDER BY DATE(race_date) DESC
+                    LIMIT 30
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT DISTINCT DATE(race_date) AS race_date, 1 AS has_racecard
+                    FROM future_race_cards
+                    ORDER BY DATE(race_date) DESC
+                    LIMIT 30
+                )
+            )
+            WHERE race_date IS NOT NULL
+            GROUP BY race_date
+            ORDER BY race_date DESC
+        """)
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    
+    # Dates come back newest first
+    sorted_dates = [race_date for race_date, _ in rows]
+    racecard_dates = {race_date for race_date, has_racecard in rows if has_racecard}
+    
+    # Precompute display strings so the combo is filled in one call
+    today = date.fromisoformat(today_iso)
+    tomorrow = today + timedelta(days=1)
+    display_items = []
+    for d in sorted_dates:
+        # Format display
+        try:
+            date_obj = date.fromisoformat(d)
+            if date_obj == today:
+                date_str = f"今日 ({d})"
+            elif date_obj == tomorrow:
+                date_str = f"明日 ({d})"
+            else:
+                date_str = date_obj.strftime('%Y-%m-%d (%a)')
+        except (TypeError, ValueError):
+            date_str = d
+        
+        # Add availability indicator based on data availability:
+        # ✓ = has racecard data (can show races)
+        # ⚠ = fixture only, no racecard yet
+        if d in racecard_dates:
+            display_items.append(f"✓ {date_str}")
+        else:
+            display_items.append(f"⚠ {date_str}")
+    
+    return tuple(sorted_dates), tuple(display_items)
+
+
+def _fetch_saved_predictions(conn: sqlite3.Connection, race_date: str,
+                             race_numbers: List[int]) -> Tuple[Dict, Dict]:
+    """Fetch stored predictions for all races of a date in one query.
+    
+    Returns two dicts of prediction tuples: one keyed by
+    (race_number, racecourse) and a fallback keyed by race_number only,
+    for logs whose racecourse spelling differs from the race card.
+    """
+    preds_by_key = defaultdict(list)
+    preds_by_num = defaultdict(list)
+    if not race_numbers:
+        return preds_by_key, preds_by_num
+    
+    # Normalize the date for comparison - extract just the date part if there's a timestamp
+    normalized_date = race_date
+    if normalized_date and ' ' in str(normalized_date):
+        normalized_date = str(normalized_date).split(' ')[0]
+    
+    try:
+        cursor = conn.cursor()
+        placeholders = ",".join("?" * len(race_numbers))
+        # DATE() matches plain and timestamped dates alike and is indexed
+        cursor.execute(f"""
+            SELECT race_number, racecourse, horse_name, predicted_win_prob, confidence, current_odds
+            FROM prediction_log
+            WHERE DATE(race_date) = ? AND race_number IN ({placeholders})
+            ORDER BY race_number, predicted_rank
+        """, (normalized_date, *race_numbers))
+        rows = cursor.fetchall()
+        cursor.close()
+    except Exception as e:
+        logger.error(f"Error loading card predictions: {e}")
+        return preds_by_key, preds_by_num
+    
+    for race_number, racecourse, horse_name, win_prob, confidence, odds in rows:
+        pred = (horse_name, win_prob, confidence, odds)
+        preds_by_key[(race_number, racecourse)].append(pred)
+        preds_by_num[race_number].append(pred)
+    return preds_by_key, preds_by_num
+
+
+def _fetch_rankings(conn: sqlite3.Connection, race_date: str) -> List[Dict]:
+    """Fetch the top-rated horses from future race cards for a date."""
+    cursor = conn.cursor()
+    try:
+        logger.debug("Loading rankings for %s", race_date)
+        # Get horses from future race cards for the selected date
+        cursor.execute("""
+            SELECT horse_name, trainer, jockey, recent_results, rating
+            FROM future_race_cards
+            WHERE DATE(race_date) = ?
+            ORDER BY rating DESC
+            LIMIT 20
+        """, (race_date,))
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    
+    # Map to widget format
+    formatted_rankings = []
+    for name, trainer, _jockey, form, rating in rows:
+        formatted_rankings.append({
+            'name': name or 'Unknown',
+            'score': float(rating or 0),
+            'trainer': trainer or 'N/A',
+            'recent_form': form or 'N/A'
+        })
+    return formatted_rankings
+
+
+@lru_cache(maxsize=8)
+def _period_summary(db_path: str, db_mtime: float, period_start: str):
+    """AccuracyTracker summary, cached until the database changes."""
+    from engine.verification.accuracy_tracker import AccuracyTracker
+    return AccuracyTracker(db_path).get_period_summary(period_start)
+
+
+def _fetch_metrics(db_path: str) -> Dict:
+    """Compute the 30-day accuracy summary shown in the metrics widget."""
+    try:
+        # Check if requests is available as it might be needed by some imports
+        try:
+            import requests
+        except ImportError:
+            logger.error("requests module is not installed. Please run: pip install requests")
+            return dict(_EMPTY_METRICS)
+        
+        # Try to get metrics from verification module
+        thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+        metrics = _period_summary(db_path, _db_mtime(db_path), thirty_days_ago)
+        
+        return {
+            'win_rate': metrics.win_rate,
+            'place_rate': metrics.place_rate,
+            'roi': metrics.roi_percent,
+            'avg_odds': metrics.average_odds,
+            'predictions': metrics.total_predictions,
+            'races': metrics.total_races
+        }
+    except Exception as e:
+        logger.error(f"Error loading metrics: {e}")
+        # Use default values
+        return dict(_EMPTY_METRICS)
+
 
 class PredictionCard(QFrame):
     """Individual prediction card for a horse."""
@@ -51,90 +449,83 @@ class PredictionCard(QFrame):
         self.confidence = confidence
         
         self.setFixedHeight(80)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DARK_COLORS['background_primary']};
-                border: 1px solid {DARK_COLORS['border_light']};
-                border-radius: 8px;
-                padding: 8px;
-            }}
-            QFrame:hover {{
-                border-color: {DARK_COLORS['accent_primary']};
-                background-color: {DARK_COLORS['background_secondary']};
-            }}
-        """)
+        self.setObjectName("predictionCard")
+        self.setAttribute(Qt.WA_StyledBackground, True)
         
         self.init_ui(odds)
     
     def init_ui(self, odds: float):
-        layout = QHBoxLayout(self)
+        # Grid with a stretch column set once, instead of a trailing spacer
+        layout = QGridLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(16)
+        layout.setHorizontalSpacing(16)
+        layout.setColumnStretch(5, 1)
         
         # Rank badge
-        rank_badge = QLabel(f"#{self.rank}")
-        rank_badge.setFixedWidth(40)
-        rank_badge.setAlignment(Qt.AlignCenter)
-        rank_badge.setFont(QFont("Arial", 14, QFont.Bold))
-        if self.rank == 1:
-            rank_badge.setStyleSheet(f"color: #FFD700; background-color: transparent;")
-        elif self.rank <= 3:
-            rank_badge.setStyleSheet(f"color: #C0C0C0; background-color: transparent;")
-        else:
-            rank_badge.setStyleSheet(f"color: {DARK_COLORS['text_secondary']}; background-color: transparent;")
-        layout.addWidget(rank_badge)
+        self.rank_badge = QLabel()
+        self.rank_badge.setFixedWidth(40)
+        self.rank_badge.setAlignment(Qt.AlignCenter)
+        self.rank_badge.setFont(QFont("Arial", 14, QFont.Bold))
+        layout.addWidget(self.rank_badge, 0, 0)
         
         # Horse name
-        name_label = QLabel(self.horse_name)
-        name_label.setFont(QFont("Arial", 12, QFont.Bold))
-        name_label.setStyleSheet(f"color: {DARK_COLORS['text_primary']};")
-        name_label.setMinimumWidth(150)
-        layout.addWidget(name_label)
+        self.name_label = QLabel()
+        self.name_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.name_label.setObjectName("primaryText")
+        self.name_label.setMinimumWidth(150)
+        layout.addWidget(self.name_label, 0, 1)
         
         # Win probability bar
         prob_layout = QVBoxLayout()
         prob_layout.setSpacing(2)
         
-        prob_label = QLabel(f"{self.win_prob:.1f}%")
-        prob_label.setFont(QFont("Arial", 11, QFont.Bold))
-        prob_label.setStyleSheet(f"color: {DARK_COLORS['accent_success']};")
-        prob_layout.addWidget(prob_label)
-        
-        prob_bar = QProgressBar()
-        prob_bar.setFixedWidth(100)
-        prob_bar.setFixedHeight(6)
-        prob_bar.setMinimum(0)
-        prob_bar.setMaximum(100)
-        prob_bar.setValue(int(self.win_prob))
-        prob_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {DARK_COLORS['background_secondary']};
-                border: none;
-                border-radius: 3px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {DARK_COLORS['accent_success']};
-                border-radius: 3px;
-            }}
-        """)
-        prob_layout.addWidget(prob_bar)
-        layout.addLayout(prob_layout)
+        self.prob_label = QLabel()
+        self.prob_label.setFont(QFont("Arial", 11, QFont.Bold))
+        self.prob_label.setObjectName("successText")
+        prob_layout.addWidget(self.prob_label)
         
-        # Confidence
-        conf_label = QLabel(f"信心: {self.confidence:.0%}")
-        conf_label.setFont(QFont("Arial", 10))
-        conf_label.setStyleSheet(f"color: {DARK_COLORS['text_muted']};")
-        conf_label.setFixedWidth(70)
-        layout.addWidget(conf_label)
-        
-        # Odds
-        if odds:
-            odds_label = QLabel(f"賠率: {odds:.1f}")
-            odds_label.setFont(QFont("Arial", 10))
-            odds_label.setStyleSheet(f"color: {DARK_COLORS['text_secondary']};")
-            layout.addWidget(odds_label)
+        self.prob_bar = QProgressBar()
+        self.prob_bar.setFixedWidth(100)
+        self.prob_bar.setFixedHeight(6)
+        self.prob_bar.setMinimum(0)
+        self.prob_bar.setMaximum(100)
+        self.prob_bar.setObjectName("probBar")
+        prob_layout.addWidget(self.prob_bar)
+        layout.addLayout(prob_layout, 0, 2)
         
-        layout.addStretch()
+        # Confidence
+        self.conf_label = QLabel()
+        self.conf_label.setFont(QFont("Arial", 10))
+        self.conf_label.setObjectName("mutedText")
+        self.conf_label.setFixedWidth(70)
+        layout.addWidget(self.conf_label, 0, 3)
+        
+        # Odds, hidden when unknown
+        self.odds_label = QLabel()
+        self.odds_label.setFont(QFont("Arial", 10))
+        self.odds_label.setObjectName("secondaryText")
+        layout.addWidget(self.odds_label, 0, 4)
+        
+        self._show_data(odds)
+    
+    def _show_data(self, odds: float):
+        """Write the current horse data into the existing child widgets."""
+        self.rank_badge.setText(f"#{self.rank}")
+        if self.rank == 1:
+            rank_style = "rankGold"
+        elif self.rank <= 3:
+            rank_style = "rankSilver"
+        else:
+            rank_style = "rankDefault"
+        if self.rank_badge.objectName() != rank_style:
+            _set_style_name(self.rank_badge, rank_style)
+        
+        self.name_label.setText(self.horse_name)
+        self.prob_label.setText(f"{self.win_prob:.1f}%")
+        self.prob_bar.setValue(int(self.win_prob))
+        self.conf_label.setText(f"信心: {self.confidence:.0%}")
+        self.odds_label.setText(f"賠率: {odds:.1f}" if odds else "")
+        self.odds_label.setVisible(bool(odds))
     
     def update_data(self, horse_name: str, rank: int, win_prob: float, 
                    confidence: float, odds: float = None):
@@ -144,13 +535,8 @@ class PredictionCard(QFrame):
         self.win_prob = win_prob
         self.confidence = confidence
         
-        # Update UI (clear and rebuild)
-        for i in reversed(range(self.layout().count())):
-            item = self.layout().takeAt(i)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        self.init_ui(odds)
+        # Update the existing labels and bar in place; no widgets are rebuilt
+        self._show_data(odds)
 
 
 class RaceCardWidget(QFrame):
@@ -165,15 +551,11 @@ class RaceCardWidget(QFrame):
         self.race_number = race_number
         self.racecourse = racecourse
         self.race_info = race_info or {}
+        self._last_fingerprint = None
+        self._pending_predictions: Optional[List[Tuple]] = None
         
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DARK_COLORS['background_primary']};
-                border: 1px solid {DARK_COLORS['border_light']};
-                border-radius: 12px;
-                padding: 16px;
-            }}
-        """)
+        self.setObjectName("raceCard")
+        self.setAttribute(Qt.WA_StyledBackground, True)
         
         self.init_ui()
     
@@ -185,44 +567,25 @@ class RaceCardWidget(QFrame):
         # Header
         header_layout = QHBoxLayout()
         
-        race_title_text = f"第{self.race_number}場 • {self.racecourse}"
-        if self.race_info.get('time'):
-            race_title_text += f" ({self.race_info['time']})"
-        
-        race_title = QLabel(race_title_text)
-        race_title.setFont(QFont("Arial", 14, QFont.Bold))
-        race_title.setStyleSheet(f"color: {DARK_COLORS['text_primary']};")
-        header_layout.addWidget(race_title)
+        self.race_title = QLabel()
+        self.race_title.setFont(QFont("Arial", 14, QFont.Bold))
+        self.race_title.setObjectName("primaryText")
+        header_layout.addWidget(self.race_title)
         
         header_layout.addStretch()
         
         # Distance and Class
-        if self.race_info:
-            info_text = f"{self.race_info.get('distance', '')}米 • {self.race_info.get('race_class', '')}"
-            if self.race_info.get('going'):
-                info_text += f" • {self.race_info['going']}"
-            
-            info_label = QLabel(info_text)
-            info_label.setFont(QFont("Arial", 10))
-            info_label.setStyleSheet(f"color: {DARK_COLORS['text_muted']};")
-            header_layout.addWidget(info_label)
+        self.info_label = QLabel()
+        self.info_label.setFont(QFont("Arial", 10))
+        self.info_label.setObjectName("mutedText")
+        header_layout.addWidget(self.info_label)
+        
+        self.update_header()
         
         # View Details Button
         view_btn = QPushButton("查看詳情")
         view_btn.setFixedWidth(100)
-        view_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a73e8;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #1557b0;
-            }
-        """)
+        view_btn.setObjectName("viewDetailsBtn")
         view_btn.clicked.connect(lambda: self.view_details.emit(
             self.race_date, self.race_number, self.racecourse
         ))
@@ -230,61 +593,108 @@ class RaceCardWidget(QFrame):
         
         layout.addLayout(header_layout)
         
-        # Horses container
-        # self.horses_container = QVBoxLayout()
-        # self.horses_container.setSpacing(8)
-        # layout.addLayout(self.horses_container)
-        
         # Footer with stats
         footer_layout = QHBoxLayout()
         footer_layout.addStretch()
         
         self.status_label = QLabel("就緒")
         self.status_label.setFont(QFont("Arial", 9))
-        self.status_label.setStyleSheet(f"color: {DARK_COLORS['text_muted']};")
+        self.status_label.setObjectName("mutedText")
         footer_layout.addWidget(self.status_label)
         
         layout.addLayout(footer_layout)
     
-    def load_predictions(self, predictions: List[Dict]):
-        """Load predictions into the race card."""
-        # # Clear existing
-        # for i in reversed(range(self.horses_container.count())):
-        #     item = self.horses_container.takeAt(i)
-        #     if item.widget():
-        #         item.widget().deleteLater()
-        
-        if not predictions:
-            no_pred = QLabel("暫無預測數據")
-            no_pred.setFont(QFont("Arial", 10))
-            no_pred.setStyleSheet(f"color: {DARK_COLORS['text_muted']};")
-            no_pred.setAlignment(Qt.AlignCenter)
-            # self.horses_container.addWidget(no_pred)
-            self.status_label.setText("無數據")
+    def update_header(self):
+        """Refresh the title and race info labels from the current race data."""
+        race_title_text = f"第{self.race_number}場 • {self.racecourse}"
+        if self.race_info.get('time'):
+            race_title_text += f" ({self.race_info['time']})"
+        self.race_title.setText(race_title_text)
+        
+        if self.race_info:
+            info_text = f"{self.race_info.get('distance', '')}米 • {self.race_info.get('race_class', '')}"
+            if self.race_info.get('going'):
+                info_text += f" • {self.race_info['going']}"
+            self.info_label.setText(info_text)
+        self.info_label.setVisible(bool(self.race_info))
+    
+    def rebind(self, race_date: str, race_number: int, racecourse: str,
+               race_info: Dict = None):
+        """Point this card at another race, updating labels in place.
+        
+        Rebinding to the same race (the periodic refresh) keeps the rendered
+        predictions and their fingerprint.
+        """
+        same_race = (race_date, race_number, racecourse) == (
+            self.race_date, self.race_number, self.racecourse)
+        self.race_date = race_date
+        self.race_number = race_number
+        self.racecourse = racecourse
+        self.race_info = race_info or {}
+        self.update_header()
+        if same_race:
             return
         
-        # Add top 5 horses
-        for i, pred in enumerate(predictions[:5]):
-            card = PredictionCard(
-                horse_name=pred.get('horse_name', 'Unknown'),
-                rank=i+1,
-                win_prob=pred.get('win_probability', 0),
-                confidence=pred.get('confidence', 0),
-                odds=pred.get('current_odds')
-            )
-            # self.horses_container.addWidget(card)
+        # Drop the previous race's predictions
+        self.set_no_predictions("就緒")
+    
+    def load_predictions(self, predictions: List[Tuple]):
+        """Load predictions into the race card.
+        
+        Each prediction is a flat (horse_name, win_probability, confidence,
+        current_odds) tuple, ordered by predicted rank. The card only shows
+        the top pick in its status line.
+        """
+        self._pending_predictions = None
+        top_preds = predictions[:5] if predictions else []
+        
+        # Skip all widget work when the data matches the last render
+        fingerprint = tuple(top_preds)
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        # Clear the warning style left by defer_predictions
+        _set_style_name(self.status_label, "mutedText")
+        
+        if not top_preds:
+            self.status_label.setText("無數據")
+            return
         
         # Update status
-        top_pick = predictions[0] if predictions else None
-        if top_pick:
-            win_prob = top_pick.get('win_probability', 0)
-            self.status_label.setText(f"首選: {top_pick.get('horse_name', '')} ({win_prob:.1f}%)")
+        top_name, top_win_prob = top_preds[0][0], top_preds[0][1]
+        self.status_label.setText(f"首選: {top_name or ''} ({top_win_prob:.1f}%)")
+    
+    def defer_predictions(self, predictions: List[Tuple]):
+        """Hold predictions until the card scrolls into view.
+        
+        Predictions matching what the card already shows stay rendered.
+        """
+        if tuple(predictions[:5]) == self._last_fingerprint:
+            self._pending_predictions = None
+            return
+        self._pending_predictions = predictions
+        self.set_loading(True)
+    
+    def set_no_predictions(self, text: str):
+        """Show ``text`` in place of any rendered or pending predictions."""
+        self._last_fingerprint = None
+        self._pending_predictions = None
+        self.status_label.setText(text)
+        _set_style_name(self.status_label, "mutedText")
+    
+    def has_pending_predictions(self) -> bool:
+        return self._pending_predictions is not None
+    
+    def load_pending_predictions(self):
+        """Render predictions held back by defer_predictions, if any."""
+        if self._pending_predictions is not None:
+            self.load_predictions(self._pending_predictions)
     
     def set_loading(self, loading: bool):
         """Set loading state."""
         if loading:
             self.status_label.setText("載入預測中...")
-            self.status_label.setStyleSheet(f"color: {DARK_COLORS['accent_warning']};")
+            _set_style_name(self.status_label, "warningText")
 
 
 class AccuracyMetricsWidget(QFrame):
@@ -292,14 +702,11 @@ class AccuracyMetricsWidget(QFrame):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DARK_COLORS['background_primary']};
-                border: 1px solid {DARK_COLORS['border_light']};
-                border-radius: 8px;
-                padding: 0;
-            }}
-        """)
+        self._last_metrics: Dict = {}
+        self._last_fingerprint = None
+        self._roi_tier = None
+        self.setObjectName("panelFrame")
+        self.setAttribute(Qt.WA_StyledBackground, True)
         self.init_ui()
     
     def init_ui(self):
@@ -310,7 +717,7 @@ class AccuracyMetricsWidget(QFrame):
         # Title
         title = QLabel("模型表現 (最近30天)")
         title.setFont(QFont("Arial", 11, QFont.Bold))
-        title.setStyleSheet(f"color: {DARK_COLORS['text_primary']};")
+        title.setObjectName("primaryText")
         layout.addWidget(title)
         
         # Metrics grid
@@ -332,13 +739,13 @@ class AccuracyMetricsWidget(QFrame):
             # Label
             lbl = QLabel(label)
             lbl.setFont(QFont("Arial", 9))
-            lbl.setStyleSheet(f"color: {DARK_COLORS['text_muted']};")
+            lbl.setObjectName("mutedText")
             metrics_layout.addWidget(lbl, i // 3 * 2, i % 3)
             
             # Value
             val_lbl = QLabel("--")
             val_lbl.setFont(QFont("Arial", 16, QFont.Bold))
-            val_lbl.setStyleSheet(f"color: {DARK_COLORS['accent_primary']};")
+            val_lbl.setObjectName("accentText")
             metrics_layout.addWidget(val_lbl, i // 3 * 2 + 1, i % 3)
             
             self.metrics_labels[key] = val_lbl
@@ -347,23 +754,30 @@ class AccuracyMetricsWidget(QFrame):
     
     def update_metrics(self, metrics: Dict):
         """Update metrics display."""
+        fingerprint = tuple(metrics.get(key, 0) for key in self.metrics_labels)
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        
+        # Only touch labels whose value actually changed
         for key, label in self.metrics_labels.items():
             value = metrics.get(key, 0)
+            if self._last_metrics.get(key) == value:
+                continue
             if key in ['win_rate', 'place_rate', 'roi']:
                 label.setText(f"{value:.1f}%")
-                # Color coding
-                if key == 'roi':
-                    if value > 0:
-                        label.setStyleSheet("color: #10b981; font-size: 16px; font-weight: bold;")
-                    elif value < -10:
-                        label.setStyleSheet("color: #ef4444; font-size: 16px; font-weight: bold;")
-                    else:
-                        label.setStyleSheet(f"color: {DARK_COLORS['accent_primary']}; font-size: 16px; font-weight: bold;")
             else:
                 label.setText(f"{value}")
+        self._last_metrics = {key: metrics.get(key, 0) for key in self.metrics_labels}
         
-        # Update based on thresholds
+        # Color coding - restyle only when the ROI tier changes
         roi = metrics.get('roi', 0)
+        tier = 1 if roi > 0 else -1 if roi < -10 else 0
+        if tier != self._roi_tier:
+            _set_style_name(self.metrics_labels['roi'], _ROI_OBJECT_NAMES[tier])
+            self._roi_tier = tier
+        
+        # Update based on thresholds
         if roi > 10:
             self.metrics_labels['roi'].setToolTip("優秀回報率")
         elif roi < -10:
@@ -375,14 +789,9 @@ class HorseRankingWidget(QFrame):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DARK_COLORS['background_primary']};
-                border: 1px solid {DARK_COLORS['border_light']};
-                border-radius: 8px;
-                padding: 0;
-            }}
-        """)
+        self._last_fingerprint = None
+        self.setObjectName("panelFrame")
+        self.setAttribute(Qt.WA_StyledBackground, True)
         self.init_ui()
     
     def init_ui(self):
@@ -393,50 +802,40 @@ class HorseRankingWidget(QFrame):
         # Title
         title = QLabel("馬匹排名")
         title.setFont(QFont("Arial", 11, QFont.Bold))
-        title.setStyleSheet(f"color: {DARK_COLORS['text_primary']};")
+        title.setObjectName("primaryText")
         layout.addWidget(title)
         
         # Table
         self.table = QTableWidget()
         self.table.setColumnCount(5)
         self.table.setHorizontalHeaderLabels(["排名", "馬匹", "評分", "練馬師", "近績"])
-        self.table.setStyleSheet(f"""
-            QTableWidget {{
-                background-color: transparent;
-                border: none;
-                font-size: 10px;
-            }}
-            QHeaderView::section {{
-                background-color: {DARK_COLORS['background_secondary']};
-                color: {DARK_COLORS['text_primary']};
-                padding: 4px;
-                font-weight: 600;
-                font-size: 10px;
-            }}
-        """)
-        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setObjectName("rankingsTable")
+        # Fixed column widths: avoids measuring every cell on each reload
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        self.table.setColumnWidth(0, 40)
+        self.table.setColumnWidth(1, 140)
+        self.table.setColumnWidth(2, 60)
+        self.table.setColumnWidth(3, 100)
+        header.setStretchLastSection(True)
         self.table.setRowCount(0)
         layout.addWidget(self.table)
         
         # Refresh button
         refresh_btn = QPushButton("重新整理")
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a73e8;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #1557b0;
-            }
-        """)
+        refresh_btn.setObjectName("smallRefreshBtn")
         layout.addWidget(refresh_btn)
     
     def load_rankings(self, rankings: List[Dict]):
         """Load horse rankings into table."""
+        fingerprint = tuple(
+            (horse.get('name'), horse.get('score'), horse.get('trainer'), horse.get('recent_form'))
+            for horse in rankings
+        )
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        
         self.table.setRowCount(len(rankings))
         
         for i, horse in enumerate(rankings):
@@ -468,30 +867,42 @@ class HorseRankingWidget(QFrame):
             form_item = QTableWidgetItem(horse.get('recent_form', 'N/A'))
             form_item.setForeground(QColor("#64748b"))
             self.table.setItem(i, 4, form_item)
-        
-        self.table.resizeColumnsToContents()
 
 
-class PredictionWorker(QThread):
-    """Background worker for batch predictions."""
-    finished = pyqtSignal(list)
+class PredictionService(QObject):
+    """Long-lived batch prediction service.
+    
+    Lives on a persistent QThread; jobs arrive through the queued ``submit``
+    slot and are processed one at a time by the thread's event loop. The
+    predictor and tracker are created on the first job and reused.
+    
+    Emits ``finished`` with a flat list of (race_number, racecourse, rows)
+    tuples, where rows are (horse_name, win_probability, confidence,
+    current_odds) for the top 5 horses - only what the race cards render.
+    """
+    finished = pyqtSignal(object)
     error = pyqtSignal(str)
     
-    def __init__(self, db_path: str, race_date: str, racecourse: str):
+    def __init__(self, db_path: str):
         super().__init__()
         self.db_path = db_path
-        self.race_date = race_date
-        self.racecourse = racecourse
-        
-    def run(self):
+        self._predictor = None
+        self._tracker = None
+    
+    @pyqtSlot(str, str)
+    def submit(self, race_date: str, racecourse: str):
         try:
-            from engine.prediction.enhanced_predictor import EnhancedRacePredictor
-            from engine.verification.accuracy_tracker import AccuracyTracker
+            if self._predictor is None:
+                from engine.prediction.enhanced_predictor import EnhancedRacePredictor
+                from engine.verification.accuracy_tracker import AccuracyTracker
+                
+                self._predictor = EnhancedRacePredictor(self.db_path)
+                self._tracker = AccuracyTracker(self.db_path)
             
-            predictor = EnhancedRacePredictor(self.db_path)
-            tracker = AccuracyTracker(self.db_path)
+            predictor = self._predictor
+            tracker = self._tracker
             
-            predictions = predictor.predict_multiple_races(self.race_date, self.racecourse)
+            predictions = predictor.predict_multiple_races(race_date, racecourse)
             
             # Log predictions to database for future retrieval (non-critical)
             # Logging failures don't prevent showing predictions
@@ -524,28 +935,114 @@ class PredictionWorker(QThread):
                     except Exception as log_err:
                         # Log but don't fail - predictions are more important than logging
                         logging_errors.append(f"Failed to log {horse_pred.get('horse_name')}: {str(log_err)}")
-                        print(f"[INFO] Logging error (non-critical): {log_err}")
+                        logger.info(f"Logging error (non-critical): {log_err}")
+            
+            # Flatten to the fields the race cards need before crossing threads
+            ui_rows = [
+                (race_pred.get('race_info', {}).get('number'),
+                 race_pred.get('race_info', {}).get('track'),
+                 [(p.get('horse_name', 'Unknown'), p.get('win_probability', 0),
+                   p.get('confidence', 0), p.get('current_odds'))
+                  for p in race_pred.get('predictions', [])[:5]])
+                for race_pred in predictions
+            ]
             
             # Always emit predictions even if logging fails
-            self.finished.emit(predictions)
+            self.finished.emit(ui_rows)
             
             # Report logging errors if any occurred
             if logging_errors:
-                print(f"[INFO] {len(logging_errors)} predictions generated but {len(logging_errors)} logging errors occurred")
+                logger.info(f"{len(logging_errors)} predictions generated but {len(logging_errors)} logging errors occurred")
         except Exception as e:
-            print(f"PredictionWorker error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"PredictionService error: {e}")
             self.error.emit(str(e))
 
 
+class HomeDataWorker(QThread):
+    """Background loader for the home page's database queries.
+    
+    Runs the requested parts ('dates', 'races', 'rankings', 'metrics') off
+    the GUI thread and emits the results; the page only updates widgets.
+    Uses the page's shared connection (opened with check_same_thread=False);
+    the page never runs two workers at once, so the connection is not used
+    concurrently and the mtime-keyed query caches stay effective.
+    """
+    dates_ready = pyqtSignal(object, object)  # dates, display strings
+    races_ready = pyqtSignal(str, object, object, object)  # race_date, races, preds_by_key, preds_by_num
+    races_error = pyqtSignal(str)
+    rankings_ready = pyqtSignal(list)
+    metrics_ready = pyqtSignal(dict)
+    
+    def __init__(self, conn: sqlite3.Connection, db_path: str, tables: frozenset, coded: frozenset,
+                 race_date: str, current_date: Optional[str], course: str, parts: set,
+                 request_seq: int = 0, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        # Latest page request this worker's results answer
+        self.request_seq = request_seq
+        self.conn = conn
+        self.db_path = db_path
+        self.tables = tables
+        self.coded = coded
+        self.race_date = race_date
+        self.current_date = current_date
+        self.course = course
+        self.parts = parts
+    
+    def run(self):
+        race_date = self.race_date
+        
+        if 'dates' in self.parts:
+            try:
+                dates, display_items = _fetch_dates(
+                    self.conn, _db_mtime(self.db_path), datetime.now().date().isoformat()
+                )
+                if dates:
+                    # Same rule the combo uses: keep the selection, else newest
+                    race_date = self.current_date if self.current_date in dates else dates[0]
+                    self.dates_ready.emit(dates, display_items)
+            except Exception as e:
+                logger.error(f"Error loading dates: {e}")
+        
+        if 'races' in self.parts:
+            try:
+                races = _fetch_races(self.conn, _db_mtime(self.db_path), self.tables, self.coded,
+                                     race_date, self.course)
+                # Existing predictions for every race, in a single query
+                preds_by_key, preds_by_num = _fetch_saved_predictions(
+                    self.conn, race_date, sorted({race[0] for race in races})
+                )
+                self.races_ready.emit(race_date, races, preds_by_key, preds_by_num)
+            except Exception as e:
+                logger.exception(f"Error loading races: {e}")
+                self.races_error.emit(str(e))
+        
+        if 'rankings' in self.parts:
+            try:
+                self.rankings_ready.emit(_fetch_rankings(self.conn, race_date))
+            except Exception as e:
+                logger.error(f"Error loading rankings: {e}")
+                self.rankings_ready.emit([])
+        
+        if 'metrics' in self.parts:
+            self.metrics_ready.emit(_fetch_metrics(self.db_path))
+
+
 class BottomCollapsibleWidget(QWidget):
-    """Widget at bottom with collapsible sections."""
+    """Widget at bottom with collapsible sections.
+    
+    The metrics and rankings widgets are created lazily from factories the
+    first time this widget is shown (or a section is expanded), so the
+    initial page construction does not pay for them.
+    """
     
-    def __init__(self, metrics_widget, rankings_widget, parent=None):
+    widgets_built = pyqtSignal()
+    
+    def __init__(self, metrics_factory, rankings_factory, parent=None):
         super().__init__(parent)
-        self.metrics_widget = metrics_widget
-        self.rankings_widget = rankings_widget
+        self._metrics_factory = metrics_factory
+        self._rankings_factory = rankings_factory
+        self.metrics_widget = None
+        self.rankings_widget = None
         self.metrics_expanded = False
         self.rankings_expanded = False
         self.init_ui()
@@ -565,24 +1062,36 @@ class BottomCollapsibleWidget(QWidget):
         self.rankings_toggle.clicked.connect(self.toggle_rankings)
         
         # Content area - both widgets side by side, always visible
-        content_layout = QHBoxLayout()
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(8)
-        
-        self.metrics_widget.setVisible(True)
-        self.rankings_widget.setVisible(True)
-        content_layout.addWidget(self.metrics_widget, 1)
-        content_layout.addWidget(self.rankings_widget, 1)
+        self.content_widget = QWidget()
+        self.content_layout = QHBoxLayout(self.content_widget)
+        self.content_layout.setContentsMargins(0, 0, 0, 0)
+        self.content_layout.setSpacing(8)
         
-        layout.addLayout(content_layout)
+        layout.addWidget(self.content_widget)
+    
+    def _ensure_built(self):
+        """Create the metrics and rankings widgets on first use."""
+        if self.metrics_widget is not None:
+            return
+        self.metrics_widget = self._metrics_factory()
+        self.rankings_widget = self._rankings_factory()
+        self.content_layout.addWidget(self.metrics_widget, 1)
+        self.content_layout.addWidget(self.rankings_widget, 1)
+        self.widgets_built.emit()
+    
+    def showEvent(self, event):
+        self._ensure_built()
+        super().showEvent(event)
     
     def toggle_metrics(self):
+        self._ensure_built()
         self.metrics_expanded = not self.metrics_expanded
         self.metrics_widget.setVisible(self.metrics_expanded)
         self.metrics_toggle.setText(f"{'▼' if self.metrics_expanded else '▶'} 模型表現")
         self.update_content_visibility()
     
     def toggle_rankings(self):
+        self._ensure_built()
         self.rankings_expanded = not self.rankings_expanded
         self.rankings_widget.setVisible(self.rankings_expanded)
         self.rankings_toggle.setText(f"{'▼' if self.rankings_expanded else '▶'} 馬匹排名")
@@ -597,6 +1106,7 @@ class RedesignedHomePage(QWidget):
     """Redesigned home page with prediction capabilities."""
     
     view_race_details = pyqtSignal(str, int, str)  # race_date, race_number, racecourse
+    _submit_prediction = pyqtSignal(str, str)  # race_date, racecourse
     
     def __init__(self, db_path: str = None, parent=None):
         super().__init__(parent)
@@ -614,14 +1124,70 @@ class RedesignedHomePage(QWidget):
                 db_path = alt_path
         
         self.db_path = db_path
+        self._conn = self._open_connection(db_path)
+        # The schema is fixed while the app runs; read the table list once
+        self._tables = frozenset(
+            name for (name,) in self._conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        )
+        # racecourse_code is added by the data pipeline; older databases
+        # without it are filtered on the equivalent expression instead
+        self._coded_tables = coded_tables(self._conn)
         
         self.selected_date = datetime.now().strftime('%Y-%m-%d')
         self.selected_course = "ST"
         self.predictor = None
-        
+        self._date_values: List[str] = []
+        self._data_worker: Optional[HomeDataWorker] = None
+        self._pending_parts: set = set()
+        # Request counter and the last request number per part, so results
+        # for a part re-requested while a worker ran can be dropped
+        self._request_seq = 0
+        self._part_requests: Dict[str, int] = {}
+        
+        self.setStyleSheet(_GLOBAL_DARK_QSS)
         self.init_ui()
+        self.init_prediction_service()
+        # closeEvent never fires for a page embedded in the main window's
+        # stack, so threads and the connection are also released on quit
+        QApplication.instance().aboutToQuit.connect(self.shutdown)
         self.load_data()
     
+    @staticmethod
+    def _open_connection(db_path: str) -> sqlite3.Connection:
+        """Open the long-lived connection shared by all home page loaders.
+        
+        Reusing one connection keeps the sqlite3 prepared-statement cache
+        warm across reloads instead of re-opening and re-parsing per call.
+        """
+        conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        # Journal mode is left to whoever owns the database file; like
+        # ui/db_pool, the UI only sets per-connection pragmas
+        conn.execute("PRAGMA temp_store=MEMORY")
+        RedesignedHomePage._ensure_indexes(conn)
+        return conn
+    
+    @staticmethod
+    def _ensure_indexes(conn: sqlite3.Connection):
+        """Create the indexes backing the home page lookups (once per startup)."""
+        for statement in _HOME_PAGE_INDEXES:
+            try:
+                conn.execute(statement)
+            except sqlite3.Error as e:
+                # Table may not exist yet in a fresh database
+                logger.warning(f"Could not create home page index: {e}")
+        conn.commit()
+    
+    def init_prediction_service(self):
+        """Start the persistent prediction thread and wire its signals."""
+        self._prediction_thread = QThread(self)
+        self._prediction_service = PredictionService(self.db_path)
+        self._prediction_service.moveToThread(self._prediction_thread)
+        self._prediction_service.finished.connect(self.on_predictions_finished)
+        self._prediction_service.error.connect(self.on_predictions_error)
+        self._submit_prediction.connect(self._prediction_service.submit)
+        self._prediction_thread.finished.connect(self._prediction_service.deleteLater)
+        self._prediction_thread.start()
+    
     def init_ui(self):
         """Initialize the redesigned UI."""
         # Main vertical layout
@@ -638,6 +1204,12 @@ class RedesignedHomePage(QWidget):
         # Bottom Section - Collapsible widgets (always visible at bottom)
         self.create_bottom_section(main_layout)
         
+        # Debounce combo changes so only the final selection triggers a reload
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(150)
+        self._reload_timer.timeout.connect(self.load_races)
+        
         # Auto-refresh timer
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.load_data)
@@ -646,13 +1218,8 @@ class RedesignedHomePage(QWidget):
     def create_control_panel(self, parent_layout: QVBoxLayout):
         """Create the control panel with date, course selectors and predict button."""
         panel = QFrame()
-        panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DARK_COLORS['background_secondary']};
-                border: 1px solid {DARK_COLORS['border_light']};
-                border-radius: 8px;
-            }}
-        """)
+        panel.setObjectName("controlPanel")
+        panel.setAttribute(Qt.WA_StyledBackground, True)
         
         layout = QHBoxLayout(panel)
         layout.setContentsMargins(12, 8, 12, 8)
@@ -664,21 +1231,12 @@ class RedesignedHomePage(QWidget):
         
         date_label = QLabel("日期")
         date_label.setFont(QFont("Arial", 9))
-        date_label.setStyleSheet(f"color: {DARK_COLORS['text_muted']};")
+        date_label.setObjectName("mutedText")
         date_layout.addWidget(date_label)
         
         self.date_combo = QComboBox()
         self.date_combo.setFixedWidth(180)
-        self.date_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {DARK_COLORS['background_primary']};
-                color: {DARK_COLORS['text_primary']};
-                border: 1px solid {DARK_COLORS['border_light']};
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-            }}
-        """)
+        self.date_combo.setObjectName("darkCombo")
         self.date_combo.currentIndexChanged.connect(self.on_date_changed)
         date_layout.addWidget(self.date_combo)
         
@@ -690,22 +1248,13 @@ class RedesignedHomePage(QWidget):
         
         course_label = QLabel("馬場")
         course_label.setFont(QFont("Arial", 9))
-        course_label.setStyleSheet(f"color: {DARK_COLORS['text_muted']};")
+        course_label.setObjectName("mutedText")
         course_layout.addWidget(course_label)
         
         self.course_combo = QComboBox()
         self.course_combo.addItems(["沙田 (ST)", "跑馬地 (HV)"])
         self.course_combo.setFixedWidth(120)
-        self.course_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {DARK_COLORS['background_primary']};
-                color: {DARK_COLORS['text_primary']};
-                border: 1px solid {DARK_COLORS['border_light']};
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-            }}
-        """)
+        self.course_combo.setObjectName("darkCombo")
         self.course_combo.currentIndexChanged.connect(self.on_course_changed)
         course_layout.addWidget(self.course_combo)
         
@@ -717,22 +1266,13 @@ class RedesignedHomePage(QWidget):
         
         race_label = QLabel("篩選")
         race_label.setFont(QFont("Arial", 9))
-        race_label.setStyleSheet(f"color: {DARK_COLORS['text_muted']};")
+        race_label.setObjectName("mutedText")
         race_layout.addWidget(race_label)
         
         self.race_combo = QComboBox()
         self.race_combo.addItem("全部賽事")
         self.race_combo.setFixedWidth(90)
-        self.race_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {DARK_COLORS['background_primary']};
-                color: {DARK_COLORS['text_primary']};
-                border: 1px solid {DARK_COLORS['border_light']};
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-            }}
-        """)
+        self.race_combo.setObjectName("darkCombo")
         race_layout.addWidget(self.race_combo)
         
         layout.addLayout(race_layout)
@@ -742,40 +1282,14 @@ class RedesignedHomePage(QWidget):
         # Generate Predictions Button
         self.predict_btn = QPushButton("生成預測")
         self.predict_btn.setFixedSize(140, 36)
-        self.predict_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DARK_COLORS['accent_success']};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: #059669;
-            }}
-            QPushButton:disabled {{
-                background-color: #475569;
-            }}
-        """)
+        self.predict_btn.setObjectName("predictBtn")
         self.predict_btn.clicked.connect(self.generate_predictions)
         layout.addWidget(self.predict_btn)
         
         # Refresh Button
         refresh_btn = QPushButton("重新整理")
         refresh_btn.setFixedSize(100, 36)
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a73e8;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #1557b0;
-            }
-        """)
+        refresh_btn.setObjectName("refreshBtn")
         refresh_btn.clicked.connect(self.load_data)
         layout.addWidget(refresh_btn)
         
@@ -785,7 +1299,7 @@ class RedesignedHomePage(QWidget):
         """Create the race cards section with its own scroll area."""
         # Create a container for race cards with header and scroll
         container = QWidget()
-        container.setStyleSheet("background-color: transparent;")
+        container.setObjectName("transparentArea")
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
@@ -795,12 +1309,12 @@ class RedesignedHomePage(QWidget):
         
         self.races_label = QLabel("賽事卡")
         self.races_label.setFont(QFont("Arial", 13, QFont.Bold))
-        self.races_label.setStyleSheet(f"color: {DARK_COLORS['text_primary']};")
+        self.races_label.setObjectName("primaryText")
         header_layout.addWidget(self.races_label)
         
         self.races_count_label = QLabel()
         self.races_count_label.setFont(QFont("Arial", 9))
-        self.races_count_label.setStyleSheet(f"color: {DARK_COLORS['text_muted']};")
+        self.races_count_label.setObjectName("mutedText")
         header_layout.addWidget(self.races_count_label)
         
         header_layout.addStretch()
@@ -810,428 +1324,290 @@ class RedesignedHomePage(QWidget):
         # Race cards scroll area - this is the scrollable part
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("background-color: transparent; border: none;")
+        scroll.setObjectName("racesScroll")
         
         self.races_container = QWidget()
-        self.races_container.setStyleSheet("background-color: transparent;")
+        self.races_container.setObjectName("transparentArea")
         self.races_layout = QGridLayout(self.races_container)
         self.races_layout.setSpacing(12)
         
+        # Pooled race cards, rebound on every reload
+        self._race_card_pool: List[RaceCardWidget] = []
+        self._active_race_cards = 0
+        
+        # Shared label for the "no races" / error message
+        self.races_message = QLabel()
+        self.races_message.setAlignment(Qt.AlignCenter)
+        self.races_message.setVisible(False)
+        self.races_layout.addWidget(self.races_message, 0, 0, 1, 2)
+        
         scroll.setWidget(self.races_container)
+        # Cards entering the viewport render their deferred predictions.
+        # Checks triggered by layout changes (new races, range changes,
+        # resizes, splitter moves, the bottom panel toggling) go through a
+        # zero-delay timer so they run once the cards have their final size
+        self._visible_check_timer = QTimer(self)
+        self._visible_check_timer.setSingleShot(True)
+        self._visible_check_timer.setInterval(0)
+        self._visible_check_timer.timeout.connect(self._load_visible_predictions)
+        scroll.verticalScrollBar().valueChanged.connect(self._load_visible_predictions)
+        scroll.verticalScrollBar().rangeChanged.connect(self._schedule_visible_check)
+        self._races_viewport = scroll.viewport()
+        self._races_viewport.installEventFilter(self)
         layout.addWidget(scroll, 1)  # Give it stretch factor to take available space
         
         parent_layout.addWidget(container, 1)  # Add to main layout with stretch
     
     def create_bottom_section(self, parent_layout: QVBoxLayout):
         """Create bottom section with collapsible metrics and rankings."""
-        # Create the widgets
-        self.metrics_widget = AccuracyMetricsWidget()
-        self.rankings_widget = HorseRankingWidget()
+        # Widgets are built lazily by the container on first show
+        self.metrics_widget = None
+        self.rankings_widget = None
         
         # Create the collapsible container - no fixed height, always show content
-        self.bottom_widget = BottomCollapsibleWidget(self.metrics_widget, self.rankings_widget)
-        self.bottom_widget.setStyleSheet("background-color: #0d1117;")
+        self.bottom_widget = BottomCollapsibleWidget(AccuracyMetricsWidget, HorseRankingWidget)
+        self.bottom_widget.setObjectName("bottomSection")
+        self.bottom_widget.setAttribute(Qt.WA_StyledBackground, True)
+        self.bottom_widget.widgets_built.connect(self.on_bottom_widgets_built)
         parent_layout.addWidget(self.bottom_widget)
     
-    def load_data(self):
-        """Load initial data."""
-        self.load_dates()
-        self.load_races()
+    def on_bottom_widgets_built(self):
+        """Populate the metrics and rankings widgets once they exist."""
+        self.metrics_widget = self.bottom_widget.metrics_widget
+        self.rankings_widget = self.bottom_widget.rankings_widget
         self.load_metrics()
         self.load_rankings_data()
     
-    def load_rankings_data(self):
-        """Load horse rankings data from future race cards."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-
-            print("=------------",self.selected_date)
-            # Get horses from future race cards for the selected date
-            cursor.execute("""
-                SELECT horse_name, trainer, jockey, recent_results, rating
-                FROM future_race_cards
-                WHERE DATE(race_date) = ?
-                ORDER BY rating DESC
-                LIMIT 20
-            """, (self.selected_date,))
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            # Map to widget format
-            formatted_rankings = []
-            for i, row in enumerate(rows):
-                formatted_rankings.append({
-                    'name': row['horse_name'] or 'Unknown',
-                    'score': float(row['rating'] or 0),
-                    'trainer': row['trainer'] or 'N/A',
-                    'recent_form': row['recent_results'] or 'N/A'
-                })
-            
-            self.rankings_widget.load_rankings(formatted_rankings)
-            
-        except Exception as e:
-            print(f"Error loading rankings: {e}")
-            self.rankings_widget.load_rankings([])
+    def load_data(self):
+        """Load initial data."""
+        self._request_load('dates', 'races', 'rankings', 'metrics')
     
     def load_dates(self):
-        """Load available dates into dropdown with availability indicators."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # Get all dates from fixtures
-            cursor.execute("""
-                SELECT DISTINCT DATE(race_date) as race_date 
-                FROM fixtures 
-                ORDER BY DATE(race_date) DESC 
-                LIMIT 30
-            """)
-            
-            fixture_dates = {row['race_date'] for row in cursor.fetchall()}
-            
-            # Get dates that have race card data
-            cursor.execute("""
-                SELECT DISTINCT DATE(race_date) as race_date 
-                FROM future_race_cards 
-                ORDER BY DATE(race_date) DESC
-                LIMIT 30
-            """)
-            
-            racecard_dates = {row['race_date'] for row in cursor.fetchall()}
-            conn.close()
-            
-            # Combine all unique dates from both sources
-            all_dates = fixture_dates.union(racecard_dates)
-            
-            if all_dates:
-                current_idx = self.date_combo.currentIndex()
-                current_date = self.date_combo.itemData(current_idx) if current_idx >= 0 else None
-                self.date_combo.clear()
-                
-                # Sort dates in descending order (newest first)
-                sorted_dates = sorted(all_dates, reverse=True)
-                
-                for d in sorted_dates:
-                    # Format display
-                    try:
-                        date_obj = datetime.strptime(d, '%Y-%m-%d')
-                        today = datetime.now().date()
-                        if date_obj.date() == today:
-                            date_str = f"今日 ({d})"
-                        elif date_obj.date() == today + timedelta(days=1):
-                            date_str = f"明日 ({d})"
-                        else:
-                            date_str = date_obj.strftime('%Y-%m-%d (%a)'
-                        )
-                    except:
-                        date_str = d
-                    
-                    # Add availability indicator based on data availability:
-                    # ✓ = has racecard data (can show races)
-                    # ⚠ = fixture only, no racecard yet
-                    if d in racecard_dates:
-                        display = f"✓ {date_str}"
-                    else:
-                        display = f"⚠ {date_str}"
-                    
-                    self.date_combo.addItem(display, d)
-                
-                # Restore selection if possible
-                if current_date:
-                    for i in range(self.date_combo.count()):
-                        if self.date_combo.itemData(i) == current_date:
-                            self.date_combo.setCurrentIndex(i)
-                            break
-                    else:
-                        # Date not found, select most recent
-                        if self.date_combo.count() > 0:
-                            self.date_combo.setCurrentIndex(0)
-                elif self.date_combo.count() > 0:
-                    self.date_combo.setCurrentIndex(0)
-        except Exception as e:
-            print(f"Error loading dates: {e}")
+        """Load available dates into dropdown with availability indicators.
+        
+        The combo is repopulated with signals blocked, so the races for the
+        resulting selection are loaded exactly once, in the same job.
+        """
+        self._request_load('dates', 'races')
     
     def load_races(self):
         """Load races for selected date."""
-        # Clear existing race cards
-        for i in reversed(range(self.races_layout.count())):
-            item = self.races_layout.itemAt(i)
-            if item.widget():
-                item.widget().deleteLater()
+        self._request_load('races')
+    
+    def load_rankings_data(self):
+        """Load horse rankings data from future race cards."""
+        self._request_load('rankings')
+    
+    def load_metrics(self):
+        """Load accuracy metrics."""
+        self._request_load('metrics')
+    
+    def _request_load(self, *parts: str):
+        """Queue data parts for the background worker.
+        
+        Only one worker runs at a time; requests made while it is busy are
+        merged and run as a single follow-up job.
+        """
+        self._request_seq += 1
+        for part in parts:
+            self._part_requests[part] = self._request_seq
+        self._pending_parts.update(parts)
+        if self._data_worker is not None or self._conn is None:
+            return
+        self._start_data_worker()
+    
+    def _start_data_worker(self):
+        parts = self._pending_parts
+        self._pending_parts = set()
+        # Nothing to fill until the lazily built bottom widgets exist
+        if self.metrics_widget is None:
+            parts.discard('metrics')
+        if self.rankings_widget is None:
+            parts.discard('rankings')
+        if not parts:
+            return
         
-        race_date = self.selected_date
+        current_idx = self.date_combo.currentIndex()
+        current_date = self._date_values[current_idx] if 0 <= current_idx < len(self._date_values) else None
+        
+        # Parented to the page and deleted once finished, so dropping the
+        # reference never destroys a thread that is still winding down
+        worker = HomeDataWorker(self._conn, self.db_path, self._tables, self._coded_tables,
+                                self.selected_date, current_date, self.selected_course, parts,
+                                self._request_seq, parent=self)
+        worker.dates_ready.connect(self._populate_dates)
+        worker.races_ready.connect(self._populate_races)
+        worker.races_error.connect(self._on_races_error)
+        worker.rankings_ready.connect(self._populate_rankings)
+        worker.metrics_ready.connect(self._populate_metrics)
+        worker.finished.connect(self._on_data_worker_finished)
+        worker.finished.connect(worker.deleteLater)
+        self._data_worker = worker
+        worker.start()
+    
+    def _on_data_worker_finished(self):
+        if self.sender() is self._data_worker:
+            self._data_worker = None
+        if self._pending_parts and self._data_worker is None:
+            self._start_data_worker()
+    
+    def _is_superseded(self, part: str) -> bool:
+        """True when ``part`` was requested again after the sending worker started."""
+        worker = self.sender()
+        return (isinstance(worker, HomeDataWorker)
+                and self._part_requests.get(part, 0) > worker.request_seq)
+    
+    def _populate_dates(self, sorted_dates: Tuple, display_items: Tuple):
+        """Fill the date combo with the dates loaded by the data worker."""
+        if self._is_superseded('dates'):
+            return
+        current_idx = self.date_combo.currentIndex()
+        current_date = self._date_values[current_idx] if 0 <= current_idx < len(self._date_values) else None
+        
+        # Repopulate without firing on_date_changed for every mutation
+        self.date_combo.blockSignals(True)
+        self.date_combo.clear()
+        self._date_values = list(sorted_dates)
+        self.date_combo.addItems(display_items)
+        
+        # Restore selection if possible, otherwise select most recent
+        if current_date in self._date_values:
+            self.date_combo.setCurrentIndex(self._date_values.index(current_date))
+        else:
+            self.date_combo.setCurrentIndex(0)
+        self.date_combo.blockSignals(False)
         
+        self.selected_date = self._date_values[self.date_combo.currentIndex()]
+    
+    def _populate_races(self, race_date: str, races: Tuple, preds_by_key: Dict,
+                        preds_by_num: Dict):
+        """Show the races loaded by the data worker.
+        
+        RaceCardWidgets are pooled across reloads: existing cards are rebound
+        to the new races and only missing ones are created.
+        """
+        if self._is_superseded('races'):
+            return
+        if not races:
+            self._show_races_message("找不到賽事。\n\n請嘗試在設定標籤中重新整理數據。", "mutedText", 12)
+            self.races_count_label.setText("(0 場賽事)")
+            return
+        
+        # Update race filter
+        current_race_idx = self.race_combo.currentIndex()
+        race_labels = ["全部賽事"]
+        race_labels.extend(f"第{race[0]}場" for race in races)
+        
+        self.race_combo.blockSignals(True)
+        self.race_combo.clear()
+        self.race_combo.addItems(race_labels)
+        if current_race_idx >= 0 and current_race_idx < self.race_combo.count():
+            self.race_combo.setCurrentIndex(current_race_idx)
+        self.race_combo.blockSignals(False)
+        
+        # Rebind all cards with painting suspended so the grid relayouts once
+        self.races_container.setUpdatesEnabled(False)
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # First check what tables exist and their schema
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row['name'] for row in cursor.fetchall()]
-            
-            races = []
-            
-            # Try future_race_cards first (most reliable)
-            if 'future_race_cards' in tables:
-                # Handle racecourse mapping to be robust (matches ST/HV or Sha Tin/Happy Valley)
-                if self.selected_course == "ST":
-                    cursor.execute("""
-                        SELECT DISTINCT race_number, racecourse, race_distance, race_class, track_going, race_time
-                        FROM future_race_cards
-                        WHERE DATE(race_date) = ? 
-                        AND (racecourse LIKE '%ST%' OR racecourse LIKE '%Sha Tin%' OR racecourse LIKE '%沙田%')
-                        ORDER BY race_number
-                    """, (race_date,))
-                elif self.selected_course == "HV":
-                    cursor.execute("""
-                        SELECT DISTINCT race_number, racecourse, race_distance, race_class, track_going, race_time
-                        FROM future_race_cards
-                        WHERE DATE(race_date) = ? 
-                        AND (racecourse LIKE '%HV%' OR racecourse LIKE '%Happy Valley%' OR racecourse LIKE '%跑馬地%')
-                        ORDER BY race_number
-                    """, (race_date,))
-                else:
-                    # Default case - all courses
-                    cursor.execute("""
-                        SELECT DISTINCT race_number, racecourse, race_distance, race_class, track_going, race_time
-                        FROM future_race_cards
-                        WHERE DATE(race_date) = ?
-                        ORDER BY race_number
-                    """, (race_date,))
-                
-                races = cursor.fetchall()
-
-            # If no races, try fixtures table
-            if not races and 'fixtures' in tables:
-                cursor.execute("PRAGMA table_info(fixtures)")
-                columns = [row['name'] for row in cursor.fetchall()]
-                
-                # Handle racecourse filtering for fixtures table
-                if self.selected_course == "ST":
-                    cursor.execute("""
-                        SELECT DISTINCT race_date, racecourse, distance as race_distance, race_class, expected_races
-                        FROM fixtures 
-                        WHERE DATE(race_date) = ? 
-                        AND (racecourse LIKE '%ST%' OR racecourse LIKE '%Sha Tin%' OR racecourse LIKE '%沙田%')
-                    """, (race_date,))
-                elif self.selected_course == "HV":
-                    cursor.execute("""
-                        SELECT DISTINCT race_date, racecourse, distance as race_distance, race_class, expected_races
-                        FROM fixtures 
-                        WHERE DATE(race_date) = ? 
-                        AND (racecourse LIKE '%HV%' OR racecourse LIKE '%Happy Valley%' OR racecourse LIKE '%跑馬地%')
-                    """, (race_date,))
-                else:
-                    cursor.execute("""
-                        SELECT DISTINCT race_date, racecourse, distance as race_distance, race_class, expected_races
-                        FROM fixtures 
-                        WHERE DATE(race_date) = ?
-                    """, (race_date,))
-                
-                fixture_races = cursor.fetchall()
-                for fr in fixture_races:
-                    # Convert sqlite3.Row to dict
-                    fr_dict = dict(fr)
-                    
-                    # Generate race numbers from 1 to expected_races
-                    expected = 8  # Default
-                    if 'expected_races' in fr_dict and fr_dict['expected_races']:
-                        try:
-                            expected = int(fr_dict['expected_races'])
-                        except:
-                            pass
-                    
-                    for race_num in range(1, min(expected + 1, 12)):
-                        races.append({
-                            'race_number': race_num,
-                            'racecourse': fr_dict.get('racecourse', 'Unknown'),
-                            'race_distance': fr_dict.get('race_distance', 'Unknown'),
-                            'race_class': fr_dict.get('race_class', 'Unknown'),
-                            'track_going': 'Unknown',
-                            'race_time': None
-                        })
-            
-            conn.close()
-            
-            if not races:
-                no_races = QLabel("找不到賽事。\n\n請嘗試在設定標籤中重新整理數據。")
-                no_races.setFont(QFont("Arial", 12))
-                no_races.setStyleSheet(f"color: {DARK_COLORS['text_muted']};")
-                no_races.setAlignment(Qt.AlignCenter)
-                self.races_layout.addWidget(no_races, 0, 0)
-                
-                self.races_count_label.setText("(0 場賽事)")
-                return
-            
-            # Update race filter
-            current_race_idx = self.race_combo.currentIndex()
-            self.race_combo.clear()
-            self.race_combo.addItem("全部賽事")
+            self.races_message.setVisible(False)
             
-            for race in races:
-                # Convert sqlite3.Row to dict if needed
-                if hasattr(race, 'keys'):
-                    race = dict(race)
-                self.race_combo.addItem(f"第{race['race_number']}場", race['race_number'])
-            
-            if current_race_idx >= 0 and current_race_idx < self.race_combo.count():
-                self.race_combo.setCurrentIndex(current_race_idx)
-            
-            # Create race cards
-            for i, race in enumerate(races):
-                # Convert sqlite3.Row to dict if needed
-                if hasattr(race, 'keys'):
-                    race = dict(race)
-                
+            # Bind race cards, growing the pool only when needed
+            for i, (race_number, racecourse, race_distance, race_class,
+                    track_going, race_time) in enumerate(races):
                 race_info = {
-                    'distance': race.get('race_distance', 'Unknown'),
-                    'race_class': race.get('race_class', 'Unknown'),
-                    'going': race.get('track_going', 'Unknown'),
-                    'time': race.get('race_time', '')
+                    'distance': race_distance,
+                    'race_class': race_class,
+                    'going': track_going,
+                    'time': race_time
                 }
-                
-                card = RaceCardWidget(
-                    race_date=race_date,
-                    race_number=race['race_number'],
-                    racecourse=race['racecourse'],
-                    race_info=race_info
-                )
-                card.view_details.connect(self.on_view_details)
-                
-                self.races_layout.addWidget(card, i // 2, i % 2)
-                
-                # Check for existing predictions in database
-                self.load_card_predictions(card)
-            
-            self.races_count_label.setText(f"({len(races)} 場賽事)")
-            
-        except Exception as e:
-            import traceback
-            print(f"[DEBUG] Error loading races: {e}")
-            print(traceback.format_exc())
-            
-            no_races = QLabel(f"載入賽事時出錯:\n{str(e)}")
-            no_races.setFont(QFont("Arial", 10))
-            no_races.setStyleSheet(f"color: {DARK_COLORS['accent_error']};")
-            no_races.setAlignment(Qt.AlignCenter)
-            self.races_layout.addWidget(no_races, 0, 0)
-    
-    def load_card_predictions(self, card: RaceCardWidget):
-        """Load existing predictions for a specific race card."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # Normalize the date for comparison - extract just the date part if there's a timestamp
-            normalized_date = card.race_date
-            if normalized_date and ' ' in str(normalized_date):
-                normalized_date = str(normalized_date).split(' ')[0]
-            
-            # Build racecourse condition based on selected course
-            # Use simple equality check to avoid binding issues
-            course_value = card.racecourse  # Use the exact value from the card
-            
-            # Try multiple date formats to ensure we find matching predictions
-            cursor.execute("""
-                SELECT horse_name, horse_number, predicted_rank, predicted_win_prob, confidence, current_odds
-                FROM prediction_log
-                WHERE (race_date = ? OR DATE(race_date) = ?) AND race_number = ? AND racecourse = ?
-                ORDER BY predicted_rank
-            """, (normalized_date, normalized_date, card.race_number, course_value))
-            
-            rows = cursor.fetchall()
-            
-            # If no results with exact match, try without racecourse filter
-            if not rows:
-                cursor.execute("""
-                    SELECT horse_name, horse_number, predicted_rank, predicted_win_prob, confidence, current_odds
-                    FROM prediction_log
-                    WHERE (race_date = ? OR DATE(race_date) = ?) AND race_number = ?
-                    ORDER BY predicted_rank
-                """, (normalized_date, normalized_date, card.race_number))
-                rows = cursor.fetchall()
             
-            conn.close()
-            
-            if rows:
-                predictions = []
-                for row in rows:
-                    predictions.append({
-                        'horse_name': row['horse_name'],
-                        'horse_number': row['horse_number'],
-                        'win_probability': row['predicted_win_prob'],
-                        'confidence': row['confidence'],
-                        'current_odds': row['current_odds']
-                    })
-                card.load_predictions(predictions)
-            else:
-                card.set_loading(False)
-                card.status_label.setText("無已儲存預測")
-                
-        except Exception as e:
-            print(f"Error loading card predictions: {e}")
-            card.set_loading(False)
-
-    def load_metrics(self):
-        """Load accuracy metrics."""
-        try:
-            # Check if requests is available as it might be needed by some imports
-            try:
-                import requests
-            except ImportError:
-                print("[ERROR] requests module is not installed. Please run: pip install requests")
-                self.metrics_widget.update_metrics({
-                    'win_rate': 0, 'place_rate': 0, 'roi': 0, 'avg_odds': 0, 'predictions': 0, 'races': 0
-                })
-                return
-
-            # Try to get metrics from verification module
-            from engine.verification.accuracy_tracker import AccuracyTracker
-            
-            tracker = AccuracyTracker(self.db_path)
-            thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-            metrics = tracker.get_period_summary(thirty_days_ago)
+                if i < len(self._race_card_pool):
+                    card = self._race_card_pool[i]
+                    card.rebind(race_date, race_number, racecourse, race_info)
+                else:
+                    card = RaceCardWidget(
+                        race_date=race_date,
+                        race_number=race_number,
+                        racecourse=racecourse,
+                        race_info=race_info
+                    )
+                    card.view_details.connect(self.on_view_details)
+                    self._race_card_pool.append(card)
+                    self.races_layout.addWidget(card, i // 2, i % 2)
+                card.setVisible(True)
             
-            self.metrics_widget.update_metrics({
-                'win_rate': metrics.win_rate,
-                'place_rate': metrics.place_rate,
-                'roi': metrics.roi_percent,
-                'avg_odds': metrics.average_odds,
-                'predictions': metrics.total_predictions,
-                'races': metrics.total_races
-            })
+                # Show existing predictions, falling back to a race-number-only match
+                # Rendering is deferred until the card is actually on screen
+                card_preds = preds_by_key.get((race_number, racecourse)) or preds_by_num.get(race_number)
+                if card_preds:
+                    card.defer_predictions(card_preds)
+                else:
+                    card.set_no_predictions("無已儲存預測")
             
-        except Exception as e:
-            print(f"Error loading metrics: {e}")
-            # Use default values
-            self.metrics_widget.update_metrics({
-                'win_rate': 0,
-                'place_rate': 0,
-                'roi': 0,
-                'avg_odds': 0,
-                'predictions': 0,
-                'races': 0
-            })
+            self._active_race_cards = len(races)
+            for card in self._race_card_pool[len(races):]:
+                card.setVisible(False)
+        finally:
+            self.races_container.setUpdatesEnabled(True)
+        
+        self.races_count_label.setText(f"({len(races)} 場賽事)")
+        
+        # Let the grid lay out before checking which cards are visible
+        self._visible_check_timer.start()
+    
+    def _schedule_visible_check(self):
+        """Check card visibility once pending layout work has run."""
+        self._visible_check_timer.start()
+    
+    def _load_visible_predictions(self):
+        """Render deferred predictions for race cards inside the viewport."""
+        for card in self._race_card_pool[:self._active_race_cards]:
+            if card.has_pending_predictions() and not card.visibleRegion().isEmpty():
+                card.load_pending_predictions()
+    
+    def eventFilter(self, obj, event):
+        if obj is self._races_viewport and event.type() == QEvent.Resize:
+            self._visible_check_timer.start()
+        return super().eventFilter(obj, event)
+    
+    def _on_races_error(self, error_msg: str):
+        if self._is_superseded('races'):
+            return
+        self._show_races_message(f"載入賽事時出錯:\n{error_msg}", "errorText", 10)
+    
+    def _show_races_message(self, text: str, style_name: str, point_size: int):
+        """Hide all race cards and show a message in the races grid."""
+        self._active_race_cards = 0
+        for card in self._race_card_pool:
+            card.setVisible(False)
+        self.races_message.setText(text)
+        self.races_message.setFont(QFont("Arial", point_size))
+        _set_style_name(self.races_message, style_name)
+        self.races_message.setVisible(True)
+    
+    def _populate_rankings(self, rankings: List[Dict]):
+        if self._is_superseded('rankings'):
+            return
+        if self.rankings_widget is not None:
+            self.rankings_widget.load_rankings(rankings)
+    
+    def _populate_metrics(self, metrics: Dict):
+        if self._is_superseded('metrics'):
+            return
+        if self.metrics_widget is not None:
+            self.metrics_widget.update_metrics(metrics)
     
     def on_date_changed(self, index: int):
         """Handle date selection change."""
         if index >= 0:
-            self.selected_date = self.date_combo.itemData(index)
-            self.load_races()
+            self.selected_date = self._date_values[index]
+            self._reload_timer.start()
     
     def on_course_changed(self, index: int):
         """Handle racecourse selection change."""
         courses = ["ST", "HV"]
         if index >= 0:
             self.selected_course = courses[index]
-            self.load_races()
+            self._reload_timer.start()
     
     def on_view_details(self, race_date: str, race_number: int, racecourse: str):
         """Handle view details request."""
@@ -1242,47 +1618,64 @@ class RedesignedHomePage(QWidget):
         self.predict_btn.setEnabled(False)
         self.predict_btn.setText("生成中...")
         
-        # Use background worker to prevent UI freeze
-        self.prediction_worker = PredictionWorker(self.db_path, self.selected_date, self.selected_course)
-        self.prediction_worker.finished.connect(self.on_predictions_finished)
-        self.prediction_worker.error.connect(self.on_predictions_error)
-        self.prediction_worker.start()
+        # Queue the job on the persistent prediction thread to keep the UI responsive
+        self._submit_prediction.emit(self.selected_date, self.selected_course)
         
     def on_predictions_finished(self, predictions):
-        print("++++++++++++++", predictions)  # correct
         """Handle finished predictions."""
-        # Update race cards with predictions
-        for i in range(self.races_layout.count()):
-            item = self.races_layout.itemAt(i)
-            if item.widget() and isinstance(item.widget(), RaceCardWidget):
-                card = item.widget()
-                race_num = card.race_number
-                
-                # Find matching predictions
-                race_preds = None
-                for pred in predictions:
-                    if pred.get('race_info', {}).get('number') == race_num:
-                        race_preds = pred.get('predictions', [])
-                        break
-                
-                if race_preds:
-                    card.load_predictions(race_preds)
+        # Index the flattened worker output by race number
+        rows_by_race = {}
+        for race_number, _racecourse, rows in predictions:
+            rows_by_race.setdefault(race_number, rows)
+        
+        # Update the active race cards with predictions
+        for card in self._race_card_pool[:self._active_race_cards]:
+            race_preds = rows_by_race.get(card.race_number)
+            if race_preds:
+                card.load_predictions(race_preds)
         
         self.predict_btn.setText("已生成!")
         self.predict_btn.setEnabled(True)
         
-        QTimer.singleShot(2000, lambda: self.predict_btn.setText("生成預測"))
+        # A bound method rather than a lambda, so the timer is dropped if
+        # the page is deleted within the two seconds
+        QTimer.singleShot(2000, self._reset_predict_button)
+    
+    def _reset_predict_button(self):
+        self.predict_btn.setText("生成預測")
         
     def on_predictions_error(self, error_msg):
         """Handle prediction error."""
-        print(f"Error generating predictions: {error_msg}")
+        logger.error(f"Error generating predictions: {error_msg}")
         self.predict_btn.setEnabled(True)
         self.predict_btn.setText("生成預測")
         from PyQt5.QtWidgets import QMessageBox
         QMessageBox.warning(self, "預測錯誤", f"生成預測失敗: {error_msg}")
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Cards may have been populated while the page was hidden
+        self._visible_check_timer.start()
+    
+    def shutdown(self):
+        """Stop the background threads and close the shared connection.
+        
+        Must run before the page is deleted: destroying a running QThread
+        aborts the process. Safe to call more than once.
+        """
+        if self._conn is None:
+            return
+        self.refresh_timer.stop()
+        self._reload_timer.stop()
+        self._pending_parts.clear()
+        self._prediction_thread.quit()
+        self._prediction_thread.wait()
+        if self._data_worker is not None:
+            self._data_worker.wait()
+        self._conn.close()
+        self._conn = None
+    
     def closeEvent(self, event):
         """Clean up on close."""
-        if hasattr(self, 'refresh_timer'):
-            self.refresh_timer.stop()
+        self.shutdown()
         super().closeEvent(event)
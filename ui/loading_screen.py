@@ -7,14 +7,175 @@ Displays progress during data pipeline initialization
 """
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QFrame, QSizePolicy
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal
-from PyQt5.QtGui import QFont, QPixmap, QPainter, QColor
-import math
+from PyQt5.QtCore import (
+    Qt, QTimer, pyqtSignal, QObject, QThreadPool
+)
+from PyQt5.QtGui import QFont, QFontMetrics, QPixmap, QImage, QImageReader, QPainter, QColor
 import os
+from functools import lru_cache
+
+from .runnables import OwnedRunnable
+from .styles import COLORS, cached_font
+
+# Edge length of the (square) box the loading image is scaled into
+IMAGE_SIZE = 380
+# Minimum gap between applied progress updates (~30 per second)
+UPDATE_INTERVAL_MS = 33
+# Progress jumps smaller than this skip the animation
+MIN_ANIMATED_STEP = 5
+# Tick of the timer easing the progress bar towards its target
+PROGRESS_TICK_MS = 30
+
+
+# (font args, text) pairs whose glyphs are shaped before the first paint
+_FONT_WARMUP = (
+    ((22, QFont.Bold), "Mr. Chan Exclusive Edition"),
+    ((14,), "Initializing... Ready! Loading Error"),
+    ((12, QFont.Bold), "0123456789%"),
+    ((11,), "Preparing data connections... Progress: 0123456789%"),
+    ((10,), "Mr. Chan Exclusive Edition"),
+)
+
+
+@lru_cache(maxsize=None)
+def _warm_fonts():
+    """Force glyph hinting/rasterization up front so the first paint is cheap"""
+    for font_args, text in _FONT_WARMUP:
+        QFontMetrics(cached_font(*font_args)).horizontalAdvance(text)
+
+
+@lru_cache(maxsize=None)
+def _get_fallback_pixmap() -> QPixmap:
+    """The 🏇 fallback, rendered once per process and kept in memory"""
+    pixmap = QPixmap(IMAGE_SIZE, IMAGE_SIZE)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setFont(cached_font(100))  # Large emoji
+    painter.setPen(QColor(COLORS['accent_primary']))
+    painter.drawText(pixmap.rect(), Qt.AlignCenter, "🏇")
+    painter.end()
+    return pixmap
 
-from .styles import COLORS
+
+# The whole loading screen style, parsed once on the top-level widget. State
+# changes flip a dynamic "state" property instead of replacing stylesheets.
+_LOADING_QSS = f"""
+    QWidget {{
+        background-color: {COLORS['background_primary']};
+    }}
+    QLabel#loadingImage {{
+        background-color: transparent;
+        color: {COLORS['accent_primary']};
+    }}
+    QLabel#loadingTitle {{
+        color: {COLORS['accent_primary']};
+        padding: 5px 0;
+    }}
+    QLabel#taskLabel {{
+        color: {COLORS['text_primary']};
+        font-weight: 500;
+        padding: 5px 0;
+    }}
+    QLabel#taskLabel[state="success"] {{
+        color: {COLORS['accent_success']};
+        font-weight: bold;
+        font-size: 16px;
+        padding: 0;
+    }}
+    QLabel#taskLabel[state="error"] {{
+        color: {COLORS['text_error']};
+        padding: 0;
+    }}
+    QLabel#percentageLabel {{
+        color: {COLORS['accent_primary']};
+    }}
+    QLabel#percentageLabel[state="success"] {{
+        color: {COLORS['accent_success']};
+    }}
+    QLabel#statusLabel {{
+        color: {COLORS['text_muted']};
+    }}
+    QLabel#statusLabel[state="error"] {{
+        color: {COLORS['text_error']};
+    }}
+    QProgressBar#loadingProgress {{
+        border: 1px solid {COLORS['border_light']};
+        border-radius: 8px;
+        background-color: {COLORS['background_secondary']};
+    }}
+    QProgressBar#loadingProgress::chunk {{
+        background-color: {COLORS['accent_primary']};
+        border-radius: 8px;
+    }}
+    QProgressBar#loadingProgress[state="success"] {{
+        border-color: {COLORS['accent_success']};
+    }}
+    QProgressBar#loadingProgress[state="success"]::chunk {{
+        background-color: {COLORS['accent_success']};
+    }}
+    QProgressBar#loadingProgress[state="error"] {{
+        border-color: {COLORS['text_error']};
+    }}
+    QProgressBar#loadingProgress[state="error"]::chunk {{
+        background-color: {COLORS['text_error']};
+    }}
+    QLabel#loadingFooter {{
+        color: {COLORS['text_muted']};
+        padding-top: 20px;
+        font-style: italic;
+    }}
+"""
+
+
+def _set_state(widget: QWidget, state: str):
+    """Switch a widget's [state=...] QSS variant and re-polish it"""
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+class _ImageLoadSignals(QObject):
+    image_ready = pyqtSignal(QImage)
+    failed = pyqtSignal(str)  # fallback reason
+
+
+class _ImageLoadTask(OwnedRunnable):
+    """Decode and scale the loading image on a pool thread.
+    
+    Works on QImage, which unlike QPixmap is safe outside the GUI thread.
+    """
+
+    def __init__(self, image_path: str):
+        super().__init__(_ImageLoadSignals())
+        self.image_path = image_path
+
+    def run(self):
+        try:
+            # Let the decoder produce the target size directly (libjpeg
+            # scales during the IDCT) instead of decoding full resolution.
+            # A missing file shows up as a read error, without a separate stat
+            reader = QImageReader(self.image_path)
+            source_size = reader.size()
+            if source_size.isValid():
+                reader.setScaledSize(source_size.scaled(IMAGE_SIZE, IMAGE_SIZE, Qt.KeepAspectRatio))
+            scaled = reader.read()
+            if scaled.isNull():
+                if reader.error() == QImageReader.FileNotFoundError:
+                    print(f"Image not found: {self.image_path}")
+                    self.signals.failed.emit("Image not found")
+                else:
+                    print(f"Error loading image: {reader.errorString()}")
+                    self.signals.failed.emit("Image file corrupted")
+                return
+            self.signals.image_ready.emit(scaled)
+            print(f"✓ Loaded image: {self.image_path}")
+        except Exception as e:
+            print(f"Error loading image: {e}")
+            self.signals.failed.emit("Could not load image")
 
 
 class LoadingScreen(QWidget):
@@ -23,27 +184,25 @@ class LoadingScreen(QWidget):
     loading_complete = pyqtSignal()
     loading_progress = pyqtSignal(str, int)  # message, percentage
 
+    # Your image path
+    _IMAGE_PATH = os.path.join(os.path.dirname(__file__), '..', 'loading.jpg')
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.current_step = 0
-        self.total_steps = 5
-        self.loading_steps = [
-            "Initializing Data Pipeline...",
-            "Loading Race Cards...",
-            "Fetching Weather Data...",
-            "Updating Horse Database...",
-            "Processing Form Lines...",
-            "Connecting Live Odds Feed..."
-        ]
-        
-        # Your image path
-        self.image_path = os.path.join(os.path.dirname(__file__), '..', 'loading.jpg')
+        self._pending_update = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self._apply_pending_update)
 
+        _warm_fonts()
         self.init_ui()
-        self.start_loading_animation()
 
     def init_ui(self):
         """Initialize the loading screen UI - WITH LARGE IMAGE"""
+        # Set before any child exists so children are styled once, on creation
+        self.setStyleSheet(_LOADING_QSS)
+        
         # Create main layout with centering
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(30, 20, 30, 20)  # Adjusted margins
@@ -52,37 +211,18 @@ class LoadingScreen(QWidget):
         main_layout.addStretch(1)
         
         # ========== LARGE IMAGE SECTION ==========
-        image_container = QWidget()
-        image_container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        image_layout = QVBoxLayout(image_container)
-        image_layout.setContentsMargins(0, 0, 0, 20)  # Space below image
-        
         # Load and display the image - LARGE SIZE
         self.image_label = QLabel()
-        
-        if os.path.exists(self.image_path):
-            try:
-                pixmap = QPixmap(self.image_path)
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(380, 380, 
-                                                 Qt.KeepAspectRatio, 
-                                                 Qt.SmoothTransformation)
-                    self.image_label.setPixmap(scaled_pixmap)
-                    print(f"✓ Loaded image: {self.image_path}")
-                else:
-                    self.set_fallback_image("Image file corrupted")
-            except Exception as e:
-                print(f"Error loading image: {e}")
-                self.set_fallback_image("Could not load image")
-        else:
-            print(f"Image not found: {self.image_path}")
-            self.set_fallback_image("Image not found")
+        self.image_label.setObjectName("loadingImage")
+        # The label is sized to the pixmap and any later resize is done by
+        # the painter at draw time, never by re-running pixmap.scaled()
+        self.image_label.setScaledContents(True)
+        self._source_pixmap = None
+        self.load_image()
         
         self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setStyleSheet("background-color: transparent;")
-        image_layout.addWidget(self.image_label)
-        
-        main_layout.addWidget(image_container, alignment=Qt.AlignCenter)
+        main_layout.addWidget(self.image_label, alignment=Qt.AlignCenter)
+        main_layout.addSpacing(20)  # Space below image
         
         # ========== CONTENT SECTION ==========
         # Create centered container for loading content
@@ -92,22 +232,15 @@ class LoadingScreen(QWidget):
         
         # Title/Heading
         title_label = QLabel("Mr. Chan Exclusive Edition")
-        title_label.setFont(QFont("Arial", 22, QFont.Bold))
-        title_label.setStyleSheet(f"""
-            color: {COLORS['accent_primary']};
-            padding: 5px 0;
-        """)
+        title_label.setObjectName("loadingTitle")
+        title_label.setFont(cached_font(22, QFont.Bold))
         title_label.setAlignment(Qt.AlignCenter)
         content_layout.addWidget(title_label)
         
         # Current task
         self.task_label = QLabel("Initializing...")
-        self.task_label.setFont(QFont("Arial", 14))
-        self.task_label.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            font-weight: 500;
-            padding: 5px 0;
-        """)
+        self.task_label.setFont(cached_font(14))
+        self.task_label.setObjectName("taskLabel")
         self.task_label.setAlignment(Qt.AlignCenter)
         self.task_label.setWordWrap(True)
         content_layout.addWidget(self.task_label)
@@ -125,42 +258,38 @@ class LoadingScreen(QWidget):
         self.progress_bar.setValue(0)
         self.progress_bar.setFixedHeight(16)
         self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {COLORS['border_light']};
-                border-radius: 8px;
-                background-color: {COLORS['background_secondary']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {COLORS['accent_primary']};
-                border-radius: 8px;
-            }}
-        """)
+        self.progress_bar.setObjectName("loadingProgress")
+        
+        # Eases the bar towards the latest reported progress, decoupling the
+        # redraw rate from how often the worker reports
+        self._target_progress = 0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_TICK_MS)
+        self._progress_timer.timeout.connect(self._step_progress)
+        
         progress_layout.addWidget(self.progress_bar)
         
         # Percentage and status row
-        status_row = QWidget()
-        status_layout = QHBoxLayout(status_row)
-        status_layout.setContentsMargins(0, 0, 0, 0)
+        status_layout = QHBoxLayout()
         status_layout.setSpacing(10)
         
         # Percentage label
         self.percentage_label = QLabel("0%")
-        self.percentage_label.setFont(QFont("Arial", 12, QFont.Bold))
-        self.percentage_label.setStyleSheet(f"color: {COLORS['accent_primary']};")
+        self.percentage_label.setFont(cached_font(12, QFont.Bold))
+        self.percentage_label.setObjectName("percentageLabel")
         self.percentage_label.setAlignment(Qt.AlignCenter)
         
         # Status details
         self.status_label = QLabel("Preparing data connections...")
-        self.status_label.setFont(QFont("Arial", 11))
-        self.status_label.setStyleSheet(f"color: {COLORS['text_muted']};")
+        self.status_label.setFont(cached_font(11))
+        self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
         
         status_layout.addWidget(self.percentage_label)
         status_layout.addWidget(self.status_label)
         status_layout.addStretch()
         
-        progress_layout.addWidget(status_row)
+        progress_layout.addLayout(status_layout)
         content_layout.addWidget(progress_container, alignment=Qt.AlignCenter)
         
         # Set content widget layout
@@ -174,94 +303,99 @@ class LoadingScreen(QWidget):
         
         # Footer
         footer = QLabel("Mr. Chan Exclusive Edition")
-        footer.setFont(QFont("Arial", 10))
-        footer.setStyleSheet(f"""
-            color: {COLORS['text_muted']};
-            padding-top: 20px;
-            font-style: italic;
-        """)
+        footer.setObjectName("loadingFooter")
+        footer.setFont(cached_font(10))
         footer.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(footer)
         
         self.setLayout(main_layout)
-        self.setStyleSheet(f"background-color: {COLORS['background_primary']};")
         
         # Set size policy to allow proper centering
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
+    def load_image(self):
+        """Load the image in the background, showing the fallback meanwhile"""
+        self.set_fallback_image("Image still loading")
+        
+        self._image_task = _ImageLoadTask(self._IMAGE_PATH)
+        self._image_task.signals.image_ready.connect(self._on_image_ready)
+        self._image_task.signals.failed.connect(self.set_fallback_image)
+        QThreadPool.globalInstance().start(self._image_task)
+
+    def _on_image_ready(self, image: QImage):
+        self._show_pixmap(QPixmap.fromImage(image))
+
+    def _show_pixmap(self, pixmap: QPixmap):
+        self._source_pixmap = pixmap
+        self.image_label.setPixmap(pixmap)
+        self.image_label.setFixedSize(pixmap.size() / pixmap.devicePixelRatio())
+
     def set_fallback_image(self, reason: str = ""):
         """Set fallback if image fails to load"""
         print(f"Using fallback image: {reason}")
-        self.image_label.setText("🏇")
-        self.image_label.setFont(QFont("Arial", 100))  # Large emoji
-        self.image_label.setStyleSheet(f"""
-            background-color: transparent;
-            color: {COLORS['accent_primary']};
-        """)
-
-    def start_loading_animation(self):
-        """Start the loading animation sequence"""
-        pass  # Real progress updates come from DataLoadingWorker
+        self._show_pixmap(_get_fallback_pixmap())
 
     def set_loading_message(self, message: str, progress: int):
-        """Update loading message and progress externally"""
+        """Update loading message and progress externally
+        
+        Updates are coalesced: only the latest one is applied, at most once
+        per UPDATE_INTERVAL_MS, however fast the worker emits.
+        """
+        self._pending_update = (message, progress)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _apply_pending_update(self):
+        if self._pending_update is None:
+            return
+        message, progress = self._pending_update
+        self._pending_update = None
+        
         self.task_label.setText(message)
-        self.progress_bar.setValue(progress)
         self.status_label.setText(f"Progress: {progress}%")
         self.percentage_label.setText(f"{progress}%")
         
-        # Smooth animation for progress bar
-        animation = QPropertyAnimation(self.progress_bar, b"value")
-        animation.setDuration(300)
-        animation.setStartValue(self.progress_bar.value() - 10 if self.progress_bar.value() > 10 else 0)
-        animation.setEndValue(progress)
-        animation.setEasingCurve(QEasingCurve.OutQuad)
-        animation.start()
+        # Ease the progress bar towards the new value; small steps and
+        # the final 100% are set directly
+        self._target_progress = progress
+        if abs(progress - self.progress_bar.value()) < MIN_ANIMATED_STEP or progress == 100:
+            self._progress_timer.stop()
+            self.progress_bar.setValue(progress)
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start()
         
         # Special styling for 100%
         if progress == 100:
             self.task_label.setText("Ready!")
-            self.task_label.setStyleSheet(f"""
-                color: {COLORS['accent_success']};
-                font-weight: bold;
-                font-size: 16px;
-            """)
+            _set_state(self.task_label, "success")
             self.status_label.setText("All systems initialized successfully")
             
             # Change progress bar to success color
-            self.progress_bar.setStyleSheet(f"""
-                QProgressBar {{
-                    border: 1px solid {COLORS['accent_success']};
-                    border-radius: 8px;
-                    background-color: {COLORS['background_secondary']};
-                }}
-                QProgressBar::chunk {{
-                    background-color: {COLORS['accent_success']};
-                    border-radius: 8px;
-                }}
-            """)
-            self.percentage_label.setStyleSheet(f"color: {COLORS['accent_success']};")
+            _set_state(self.progress_bar, "success")
+            _set_state(self.percentage_label, "success")
+
+    def _step_progress(self):
+        """Move the bar a quarter of the remaining distance (at least 1)"""
+        value = self.progress_bar.value()
+        remaining = self._target_progress - value
+        if remaining == 0:
+            self._progress_timer.stop()
+            return
+        step = max(1, abs(remaining) // 4)
+        self.progress_bar.setValue(value + step if remaining > 0 else value - step)
+        if self.progress_bar.value() == self._target_progress:
+            self._progress_timer.stop()
 
     def show_error(self, error_message: str):
         """Display error state"""
+        # Drop any queued progress update so it cannot overwrite the error
+        self._update_timer.stop()
+        self._pending_update = None
         self.task_label.setText("Loading Error")
-        self.task_label.setStyleSheet(f"""
-            color: {COLORS['text_error']};
-            font-weight: 500;
-        """)
+        _set_state(self.task_label, "error")
         self.status_label.setText(error_message)
-        self.status_label.setStyleSheet(f"color: {COLORS['text_error']};")
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {COLORS['text_error']};
-                border-radius: 8px;
-                background-color: {COLORS['background_secondary']};
-            }}
-            QProgressBar::chunk {{
-                background-color: {COLORS['text_error']};
-                border-radius: 8px;
-            }}
-        """)
+        _set_state(self.status_label, "error")
+        _set_state(self.progress_bar, "error")
 
     def close_animation(self):
         """Clean up animation timers and signal completion"""
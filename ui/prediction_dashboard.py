@@ -9,25 +9,145 @@ Features:
 """
 
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableView,
     QScrollArea, QFrame, QPushButton, QTabWidget, QWidget, QTextEdit,
-    QGridLayout, QProgressBar, QGroupBox, QComboBox
+    QGridLayout, QProgressBar, QGroupBox, QComboBox, QAbstractItemView, QHeaderView
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QColor, QPixmap
+from PyQt5.QtCore import (
+    Qt, QObject, QThreadPool, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex
+)
+from PyQt5.QtGui import QFont, QPixmap
 import os
 import sqlite3
+import threading
+import time
+from copy import deepcopy
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from . import db_pool
+from .runnables import OwnedRunnable
+from .styles import TABLE_COLORS, cached_font
+
+
+# One predictor per database; construction loads every analyzer and the calibrator
+_PREDICTOR_CACHE: Dict[str, object] = {}
+_PREDICTOR_LOCK = threading.Lock()
+
+# predict_race results keyed by (db_path, date, race, course, race fingerprint),
+# the same invalidation rule as the prediction detail modal
+_RESULT_CACHE: Dict[tuple, tuple] = {}
+_RESULT_LOCK = threading.Lock()
+_RESULT_TTL = 300  # seconds
+_RESULT_CACHE_SIZE = 64
+
+# Table rows added per event-loop turn, so the top picks paint first
+_TABLE_CHUNK = 5
+
+# Section rules for the plain-text reasons view
+_SEP60 = "=" * 60
+_SEP40 = "-" * 40
+
+# Stylesheets are shared by every modal instance
+_QSS_TABS = """
+    QTabWidget::pane {
+        border: 1px solid #334155;
+        background-color: #0f172a;
+    }
+    QTabBar::tab {
+        background-color: #1e293b;
+        color: #cbd5e1;
+        padding: 10px 20px;
+        border: 1px solid #334155;
+        font-weight: 600;
+    }
+    QTabBar::tab:selected {
+        background-color: #334155;
+        color: #f8fafc;
+        border-bottom: 2px solid #3b82f6;
+    }
+"""
+
+_QSS_CLOSE_BTN = """
+    QPushButton {
+        background-color: #3b82f6;
+        color: #f8fafc;
+        border: none;
+        border-radius: 6px;
+        font-weight: 600;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #2563eb;
+    }
+"""
+
+_QSS_TABLE = """
+    QTableView {
+        background-color: #0f172a;
+        border: 1px solid #334155;
+        gridline-color: #334155;
+        font-size: 12px;
+    }
+    QTableView::item {
+        padding: 10px 8px;
+        color: #f8fafc;
+    }
+    QHeaderView::section {
+        background-color: #1e293b;
+        color: #f8fafc;
+        padding: 10px;
+        font-weight: 600;
+        border: 1px solid #334155;
+    }
+"""
+
+_QSS_COMBO = """
+    QComboBox {
+        background-color: #1e293b;
+        color: #f8fafc;
+        border: 1px solid #334155;
+        border-radius: 4px;
+        padding: 8px 12px;
+        min-width: 200px;
+    }
+"""
+
+_QSS_REASONS = """
+    QTextEdit {
+        background-color: #0f172a;
+        color: #f8fafc;
+        border: 1px solid #334155;
+        border-radius: 8px;
+        padding: 16px;
+        font-family: 'SF Mono', 'Consolas', monospace;
+        font-size: 12px;
+        line-height: 1.6;
+    }
+"""
+
+_QSS_GROUPBOX = """
+    QGroupBox {
+        color: #f8fafc;
+        font-weight: 600;
+        border: 1px solid #334155;
+        border-radius: 8px;
+        padding: 16px;
+        margin-top: 8px;
+    }
+"""
 
-class SingleRacePredictionWorker(QThread):
-    """Background worker for single race prediction."""
+
+class _SingleRacePredictionSignals(QObject):
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
+
+
+class SingleRacePredictionRunnable(OwnedRunnable):
+    """Single race prediction run on the shared thread pool."""
     
     def __init__(self, db_path: str, race_date: str, race_number: int, racecourse: str):
-        super().__init__()
+        super().__init__(_SingleRacePredictionSignals())
         self.db_path = db_path
         self.race_date = race_date
         self.race_number = race_number
@@ -35,12 +155,129 @@ class SingleRacePredictionWorker(QThread):
         
     def run(self):
         try:
-            from engine.prediction.enhanced_predictor import EnhancedRacePredictor
-            predictor = EnhancedRacePredictor(self.db_path)
-            result = predictor.predict_race(self.race_date, self.race_number, self.racecourse)
-            self.finished.emit(result)
+            with db_pool.acquire(self.db_path) as conn:
+                fingerprint = db_pool.race_fingerprint(
+                    conn, self.race_date, self.race_number, self.racecourse)
+            key = (self.db_path, self.race_date, self.race_number, self.racecourse, fingerprint)
+            with _RESULT_LOCK:
+                cached = _RESULT_CACHE.get(key)
+            if cached and time.time() - cached[0] < _RESULT_TTL:
+                self.signals.finished.emit(deepcopy(cached[1]))
+                return
+            
+            # predict_race shares analyzer state, so pool threads take turns
+            with _PREDICTOR_LOCK:
+                predictor = _PREDICTOR_CACHE.get(self.db_path)
+                if predictor is None:
+                    from engine.prediction.enhanced_predictor import EnhancedRacePredictor
+                    predictor = EnhancedRacePredictor(self.db_path)
+                    _PREDICTOR_CACHE[self.db_path] = predictor
+                result = predictor.predict_race(self.race_date, self.race_number, self.racecourse)
+            if 'error' not in result:
+                with _RESULT_LOCK:
+                    _RESULT_CACHE.pop(key, None)
+                    if len(_RESULT_CACHE) >= _RESULT_CACHE_SIZE:
+                        del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+                    _RESULT_CACHE[key] = (time.time(), deepcopy(result))
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+
+class PredictionTableModel(QAbstractTableModel):
+    """Read-only table model over a race's prediction dicts."""
+    
+    HEADERS = ["排名", "馬匹", "勝率", "位置率", "信心度",
+               "賠率", "價值", "風險", "騎師", "練馬師"]
+    COLUMN_WIDTHS = [50, 140, 70, 70, 70, 70, 70, 60, 120, 120]
+    NAME_COLUMN = 1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (text, foreground, background) per cell, formatted once per load
+        self._rows = []
+    
+    def set_predictions(self, predictions: List[Dict]):
+        """Replace the table contents with a single model reset."""
+        self.beginResetModel()
+        self._rows = [self._build_row(rank, pred)
+                      for rank, pred in enumerate(predictions, start=1)]
+        self.endResetModel()
+    
+    def append_predictions(self, predictions: List[Dict]):
+        """Append rows after the current ones, ranked from where they left off."""
+        if not predictions:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(predictions) - 1)
+        self._rows.extend(self._build_row(rank, pred)
+                          for rank, pred in enumerate(predictions, start=first + 1))
+        self.endInsertRows()
+    
+    @staticmethod
+    def _build_row(rank: int, pred: Dict) -> tuple:
+        colors = TABLE_COLORS
+        row_bg = colors['bg_row']
+        g = pred.get
+        win_prob = g('win_probability', 0)
+        place_prob = g('place_probability', 0)
+        conf = g('confidence', 0) * 100
+        odds = g('current_odds')
+        value = g('value_pct')
+        risk = g('risk_score', 0)
+        
+        if value is None:
+            value_cell = ("N/A", colors['dim'], row_bg)
+        elif value > 10:
+            value_cell = (f"{value:+.0f}%", colors['green'], row_bg)
+        elif value < -10:
+            value_cell = (f"{value:+.0f}%", colors['red'], row_bg)
+        else:
+            value_cell = (f"{value:+.0f}%", colors['muted'], row_bg)
+        
+        if risk > 60:
+            risk_fg = colors['red']
+        elif risk > 40:
+            risk_fg = colors['amber']
+        else:
+            risk_fg = colors['green']
+        
+        return (
+            # Rank column sits on the alternate background
+            (str(rank), colors['text'], colors['bg_alt']),
+            (g('horse_name', '未知'), colors['text'], row_bg),
+            (f"{win_prob:.1f}%", colors['green'], row_bg),
+            (f"{place_prob:.1f}%", colors['blue'], row_bg),
+            (f"{conf:.0f}%", colors['amber'], row_bg),
+            (f"{odds:.1f}" if odds and odds > 0 else "N/A", colors['muted'], row_bg),
+            value_cell,
+            (f"{risk:.0f}", risk_fg, row_bg),
+            (g('jockey', 'N/A'), colors['muted'], row_bg),
+            (g('trainer', 'N/A'), colors['muted'], row_bg),
+        )
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        text, fg, bg = self._rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.ForegroundRole:
+            return fg
+        if role == Qt.BackgroundRole:
+            return bg
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class PredictionDetailModal(QDialog):
@@ -52,20 +289,22 @@ class PredictionDetailModal(QDialog):
         self.race_date = race_date
         self.race_number = race_number
         self.racecourse = racecourse
+        self.predictions = []
+        self._table_fill_pos = 0
+        self._reasons_cache = {}
+        self._pending_reason_index = 0
         
         if db_path is None:
             # Use absolute path from the project root
             script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             db_path = os.path.join(script_dir, 'database', 'hkjc_races.db')
         
-        # Verify database exists
-        if not os.path.exists(db_path):
-            # Try alternative path
-            alt_path = os.path.join(os.path.dirname(__file__), '..', '..', 'database', 'hkjc_races.db')
-            if os.path.exists(alt_path):
-                db_path = alt_path
-        
-        self.db_path = db_path
+        # First existing candidate wins; keep the requested path otherwise
+        candidates = (
+            db_path,
+            os.path.join(os.path.dirname(__file__), '..', '..', 'database', 'hkjc_races.db'),
+        )
+        self.db_path = next((p for p in candidates if os.path.exists(p)), db_path)
         
         self.setWindowTitle(f"第{race_number}場預測 - {race_date}")
         self.setMinimumSize(1200, 800)
@@ -84,7 +323,7 @@ class PredictionDetailModal(QDialog):
         header_layout = QHBoxLayout()
         
         title = QLabel(f"第{self.race_number}場 • {self.racecourse} • {self.race_date}")
-        title.setFont(QFont("Arial", 18, QFont.Bold))
+        title.setFont(cached_font(18, QFont.Bold))
         title.setStyleSheet("color: #f8fafc;")
         header_layout.addWidget(title)
         
@@ -99,34 +338,22 @@ class PredictionDetailModal(QDialog):
         
         # Tab widget
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane { 
-                border: 1px solid #334155; 
-                background-color: #0f172a;
-            }
-            QTabBar::tab { 
-                background-color: #1e293b; 
-                color: #cbd5e1; 
-                padding: 10px 20px;
-                border: 1px solid #334155;
-                font-weight: 600;
-            }
-            QTabBar::tab:selected { 
-                background-color: #334155; 
-                color: #f8fafc;
-                border-bottom: 2px solid #3b82f6;
-            }
-        """)
+        self.tabs.setStyleSheet(_QSS_TABS)
         layout.addWidget(self.tabs)
         
         # Tab 1: Predictions Table
         self.create_predictions_tab()
         
-        # Tab 2: Detailed Reasons
-        self.create_reasons_tab()
+        # Tabs 2 and 3 are empty pages until first shown
+        self._reasons_tab = QWidget()
+        self._reasons_built = False
+        self.tabs.addTab(self._reasons_tab, "詳細理由")
+        
+        self._analysis_tab = QWidget()
+        self._analysis_built = False
+        self.tabs.addTab(self._analysis_tab, "賽事分析")
         
-        # Tab 3: Analysis
-        self.create_analysis_tab()
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # Footer
         footer_layout = QHBoxLayout()
@@ -134,19 +361,7 @@ class PredictionDetailModal(QDialog):
         
         close_btn = QPushButton("關閉")
         close_btn.setFixedSize(100, 40)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3b82f6;
-                color: #f8fafc;
-                border: none;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #2563eb;
-            }
-        """)
+        close_btn.setStyleSheet(_QSS_CLOSE_BTN)
         close_btn.clicked.connect(self.accept)
         footer_layout.addWidget(close_btn)
         
@@ -162,46 +377,38 @@ class PredictionDetailModal(QDialog):
         summary_layout = QHBoxLayout()
         
         self.win_pick_label = QLabel("首選: --")
-        self.win_pick_label.setFont(QFont("Arial", 14, QFont.Bold))
+        self.win_pick_label.setFont(cached_font(14, QFont.Bold))
         self.win_pick_label.setStyleSheet("color: #10b981;")
         summary_layout.addWidget(self.win_pick_label)
         
         summary_layout.addStretch()
         
         self.confidence_label = QLabel("信心度: --")
-        self.confidence_label.setFont(QFont("Arial", 12))
+        self.confidence_label.setFont(cached_font(12))
         self.confidence_label.setStyleSheet("color: #94a3b8;")
         summary_layout.addWidget(self.confidence_label)
         
         layout.addLayout(summary_layout)
         
         # Table
-        self.pred_table = QTableWidget()
-        self.pred_table.setColumnCount(10)
-        self.pred_table.setHorizontalHeaderLabels([
-            "排名", "馬匹", "勝率", "位置率", "信心度", 
-            "賠率", "價值", "風險", "騎師", "練馬師"
-        ])
-        self.pred_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #0f172a;
-                border: 1px solid #334155;
-                gridline-color: #334155;
-                font-size: 12px;
-            }
-            QTableWidget::item {
-                padding: 10px 8px;
-                color: #f8fafc;
-            }
-            QHeaderView::section {
-                background-color: #1e293b;
-                color: #f8fafc;
-                padding: 10px;
-                font-weight: 600;
-                border: 1px solid #334155;
-            }
-        """)
-        self.pred_table.horizontalHeader().setStretchLastSection(True)
+        self.pred_model = PredictionTableModel(self)
+        self.pred_table = QTableView()
+        self.pred_table.setModel(self.pred_model)
+        self.pred_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.pred_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.pred_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.pred_table.setAlternatingRowColors(False)
+        # Fixed row height: padding in the item QSS fits 36px, no per-row measuring
+        v_header = self.pred_table.verticalHeader()
+        v_header.setSectionResizeMode(QHeaderView.Fixed)
+        v_header.setDefaultSectionSize(36)
+        self.pred_table.setStyleSheet(_QSS_TABLE)
+        # Column contents are regular, so fixed widths replace resizeColumnsToContents
+        h_header = self.pred_table.horizontalHeader()
+        h_header.setSectionResizeMode(QHeaderView.Fixed)
+        for col, width in enumerate(PredictionTableModel.COLUMN_WIDTHS):
+            self.pred_table.setColumnWidth(col, width)
+        h_header.setSectionResizeMode(PredictionTableModel.NAME_COLUMN, QHeaderView.Stretch)
         layout.addWidget(self.pred_table)
         
         # Legend
@@ -215,7 +422,7 @@ class PredictionDetailModal(QDialog):
         
         for text, color in legend_items:
             lbl = QLabel(text)
-            lbl.setFont(QFont("Arial", 10))
+            lbl.setFont(cached_font(10))
             lbl.setStyleSheet(f"color: {color};")
             legend_layout.addWidget(lbl)
         
@@ -226,30 +433,28 @@ class PredictionDetailModal(QDialog):
     
     def create_reasons_tab(self):
         """Create the detailed reasons tab."""
-        tab = QWidget()
+        tab = self._reasons_tab
         layout = QVBoxLayout(tab)
         layout.setContentsMargins(16, 16, 16, 16)
         
+        # Debounce selector changes so scrubbing only builds the final horse
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(80)
+        self._select_timer.timeout.connect(
+            lambda: self.on_horse_selected(self._pending_reason_index))
+        
         # Horse selector
         selector_layout = QHBoxLayout()
         
         selector_label = QLabel("選擇馬匹:")
-        selector_label.setFont(QFont("Arial", 12))
+        selector_label.setFont(cached_font(12))
         selector_label.setStyleSheet("color: #94a3b8;")
         selector_layout.addWidget(selector_label)
         
         self.horse_selector = QComboBox()
-        self.horse_selector.setStyleSheet("""
-            QComboBox {
-                background-color: #1e293b;
-                color: #f8fafc;
-                border: 1px solid #334155;
-                border-radius: 4px;
-                padding: 8px 12px;
-                min-width: 200px;
-            }
-        """)
-        self.horse_selector.currentIndexChanged.connect(self.on_horse_selected)
+        self.horse_selector.setStyleSheet(_QSS_COMBO)
+        self.horse_selector.currentIndexChanged.connect(self.on_horse_index_changed)
         selector_layout.addWidget(self.horse_selector)
         
         selector_layout.addStretch()
@@ -258,41 +463,21 @@ class PredictionDetailModal(QDialog):
         # Reasons content
         self.reasons_content = QTextEdit()
         self.reasons_content.setReadOnly(True)
-        self.reasons_content.setStyleSheet("""
-            QTextEdit {
-                background-color: #0f172a;
-                color: #f8fafc;
-                border: 1px solid #334155;
-                border-radius: 8px;
-                padding: 16px;
-                font-family: 'SF Mono', 'Consolas', monospace;
-                font-size: 12px;
-                line-height: 1.6;
-            }
-        """)
+        self.reasons_content.setStyleSheet(_QSS_REASONS)
         layout.addWidget(self.reasons_content)
         
-        self.tabs.addTab(tab, "詳細理由")
+        self._reasons_built = True
     
     def create_analysis_tab(self):
         """Create the analysis tab."""
-        tab = QWidget()
+        tab = self._analysis_tab
+        # One sheet on the tab styles both group boxes
+        tab.setStyleSheet(_QSS_GROUPBOX)
         layout = QVBoxLayout(tab)
         layout.setContentsMargins(16, 16, 16, 16)
         
         # Race info
         info_group = QGroupBox("賽事資訊")
-        info_group.setStyleSheet(f"""
-            QGroupBox {{
-                color: #f8fafc;
-                font-weight: 600;
-                border: 1px solid #334155;
-                border-radius: 8px;
-                padding: 16px;
-                margin-top: 8px;
-            }}
-        """)
-        
         info_layout = QGridLayout(info_group)
         
         info_items = [
@@ -304,6 +489,7 @@ class PredictionDetailModal(QDialog):
             ("參賽馬數:", "field_size", ""),
         ]
         
+        self._info_labels = {}
         for i, (label, key, default) in enumerate(info_items):
             lbl = QLabel(label)
             lbl.setStyleSheet("color: #94a3b8;")
@@ -311,24 +497,13 @@ class PredictionDetailModal(QDialog):
             
             val = QLabel(default)
             val.setStyleSheet("color: #f8fafc; font-weight: 600;")
-            val.setObjectName(key)
+            self._info_labels[key] = val
             info_layout.addWidget(val, i // 3 * 2 + 1, i % 3)
         
         layout.addWidget(info_group)
         
         # Model info
         model_group = QGroupBox("模型資訊")
-        model_group.setStyleSheet(f"""
-            QGroupBox {{
-                color: #f8fafc;
-                font-weight: 600;
-                border: 1px solid #334155;
-                border-radius: 8px;
-                padding: 16px;
-                margin-top: 8px;
-            }}
-        """)
-        
         model_layout = QVBoxLayout(model_group)
         
         self.model_info = QLabel("模型: 增強版 v2.0\n校準: 冪律\n特徵: 100+")
@@ -338,17 +513,17 @@ class PredictionDetailModal(QDialog):
         layout.addWidget(model_group)
         layout.addStretch()
         
-        self.tabs.addTab(tab, "賽事分析")
+        self._analysis_built = True
     
     def load_predictions(self):
         """Load predictions from the predictor."""
         self.status_label.setText("計算預測中...")
         self.status_label.setStyleSheet("color: #3b82f6;")
         
-        self.worker = SingleRacePredictionWorker(self.db_path, self.race_date, self.race_number, self.racecourse)
-        self.worker.finished.connect(self.on_predictions_finished)
-        self.worker.error.connect(self.on_predictions_error)
-        self.worker.start()
+        self.worker = SingleRacePredictionRunnable(self.db_path, self.race_date, self.race_number, self.racecourse)
+        self.worker.signals.finished.connect(self.on_predictions_finished)
+        self.worker.signals.error.connect(self.on_predictions_error)
+        QThreadPool.globalInstance().start(self.worker)
         
     def on_predictions_finished(self, result):
         """Handle finished predictions."""
@@ -359,6 +534,7 @@ class PredictionDetailModal(QDialog):
         
         self.result = result
         self.predictions = result.get('predictions', [])
+        self._reasons_cache.clear()
         self.race_info = result.get('race_info', {})
         
         # Update UI
@@ -382,92 +558,10 @@ class PredictionDetailModal(QDialog):
     
     def update_predictions_table(self):
         """Update the predictions table."""
-        self.pred_table.setRowCount(len(self.predictions))
-        
-        for row_idx, pred in enumerate(self.predictions):
-            # Rank
-            rank_item = QTableWidgetItem(str(row_idx + 1))
-            rank_item.setForeground(QColor("#f8fafc"))
-            rank_item.setBackground(QColor("#1e293b"))
-            self.pred_table.setItem(row_idx, 0, rank_item)
-            
-            # Horse name
-            name_item = QTableWidgetItem(pred.get('horse_name', '未知'))
-            name_item.setForeground(QColor("#f8fafc"))
-            name_item.setBackground(QColor("#0f172a"))
-            self.pred_table.setItem(row_idx, 1, name_item)
-            
-            # Win probability
-            win_prob = pred.get('win_probability', 0)
-            win_item = QTableWidgetItem(f"{win_prob:.1f}%")
-            win_item.setForeground(QColor("#10b981"))
-            win_item.setBackground(QColor("#0f172a"))
-            self.pred_table.setItem(row_idx, 2, win_item)
-            
-            # Place probability
-            place_prob = pred.get('place_probability', 0)
-            place_item = QTableWidgetItem(f"{place_prob:.1f}%")
-            place_item.setForeground(QColor("#3b82f6"))
-            place_item.setBackground(QColor("#0f172a"))
-            self.pred_table.setItem(row_idx, 3, place_item)
-            
-            # Confidence
-            conf = pred.get('confidence', 0) * 100
-            conf_item = QTableWidgetItem(f"{conf:.0f}%")
-            conf_item.setForeground(QColor("#f59e0b"))
-            conf_item.setBackground(QColor("#0f172a"))
-            self.pred_table.setItem(row_idx, 4, conf_item)
-            
-            # Odds
-            odds = pred.get('current_odds')
-            if odds and odds > 0:
-                odds_item = QTableWidgetItem(f"{odds:.1f}")
-            else:
-                odds_item = QTableWidgetItem("N/A")
-            odds_item.setForeground(QColor("#94a3b8"))
-            odds_item.setBackground(QColor("#0f172a"))
-            self.pred_table.setItem(row_idx, 5, odds_item)
-            
-            # Value
-            value = pred.get('value_pct')
-            if value is not None:
-                value_item = QTableWidgetItem(f"{value:+.0f}%")
-                if value > 10:
-                    value_item.setForeground(QColor("#10b981"))
-                elif value < -10:
-                    value_item.setForeground(QColor("#ef4444"))
-                else:
-                    value_item.setForeground(QColor("#94a3b8"))
-                value_item.setBackground(QColor("#0f172a"))
-            else:
-                value_item = QTableWidgetItem("N/A")
-                value_item.setForeground(QColor("#64748b"))
-                value_item.setBackground(QColor("#0f172a"))
-            self.pred_table.setItem(row_idx, 6, value_item)
-            
-            # Risk
-            risk = pred.get('risk_score', 0)
-            risk_item = QTableWidgetItem(f"{risk:.0f}")
-            if risk > 60:
-                risk_item.setForeground(QColor("#ef4444"))
-            elif risk > 40:
-                risk_item.setForeground(QColor("#f59e0b"))
-            else:
-                risk_item.setForeground(QColor("#10b981"))
-            risk_item.setBackground(QColor("#0f172a"))
-            self.pred_table.setItem(row_idx, 7, risk_item)
-            
-            # Jockey
-            jockey_item = QTableWidgetItem(pred.get('jockey', 'N/A'))
-            jockey_item.setForeground(QColor("#94a3b8"))
-            jockey_item.setBackground(QColor("#0f172a"))
-            self.pred_table.setItem(row_idx, 8, jockey_item)
-            
-            # Trainer
-            trainer_item = QTableWidgetItem(pred.get('trainer', 'N/A'))
-            trainer_item.setForeground(QColor("#94a3b8"))
-            trainer_item.setBackground(QColor("#0f172a"))
-            self.pred_table.setItem(row_idx, 9, trainer_item)
+        self.pred_model.set_predictions(self.predictions[:_TABLE_CHUNK])
+        self._table_fill_pos = _TABLE_CHUNK
+        if len(self.predictions) > _TABLE_CHUNK:
+            QTimer.singleShot(0, self._append_table_chunk)
         
         # Update summary
         if self.predictions:
@@ -475,144 +569,169 @@ class PredictionDetailModal(QDialog):
             self.win_pick_label.setText(f"首選: {top.get('horse_name', '未知')}")
             conf = top.get('confidence', 0) * 100
             self.confidence_label.setText(f"信心度: {conf:.0f}%")
-        
-        self.pred_table.resizeColumnsToContents()
+    
+    def _append_table_chunk(self):
+        """Append the next batch of rows, yielding to paint between batches."""
+        pos = self._table_fill_pos
+        if pos >= len(self.predictions):
+            return
+        self._table_fill_pos = pos + _TABLE_CHUNK
+        self.pred_model.append_predictions(self.predictions[pos:pos + _TABLE_CHUNK])
+        if self._table_fill_pos < len(self.predictions):
+            QTimer.singleShot(0, self._append_table_chunk)
     
     def update_horse_selector(self):
         """Update the horse selector dropdown."""
-        self.horse_selector.clear()
-        
-        for pred in self.predictions:
-            rank = self.predictions.index(pred) + 1
-            self.horse_selector.addItem(f"#{rank} - {pred.get('horse_name', '未知')}", pred)
+        self._pending_reason_index = 0
+        if not self._reasons_built:
+            return
         
-        # Select first horse by default
-        if self.predictions:
-            self.on_horse_selected(0)
+        self.horse_selector.blockSignals(True)
+        try:
+            self.horse_selector.clear()
+            for rank, pred in enumerate(self.predictions, start=1):
+                self.horse_selector.addItem(f"#{rank} - {pred.get('horse_name', '未知')}", pred)
+        finally:
+            self.horse_selector.blockSignals(False)
+        
+        # Reasons for the first horse are built when the tab is first shown
+        self._select_timer.stop()
+        self.reasons_content.clear()
+        if self.tabs.currentWidget() is self._reasons_tab:
+            self.on_horse_selected(self._pending_reason_index)
+    
+    def _on_tab_changed(self, index: int):
+        """Build lazy tabs and pending reasons text when a tab is opened."""
+        page = self.tabs.widget(index)
+        if page is self._reasons_tab:
+            if not self._reasons_built:
+                self.create_reasons_tab()
+                self.update_horse_selector()
+            elif not self.reasons_content.toPlainText():
+                self.on_horse_selected(self._pending_reason_index)
+        elif page is self._analysis_tab and not self._analysis_built:
+            self.create_analysis_tab()
+            if hasattr(self, 'result'):
+                self.update_race_info()
+    
+    def on_horse_index_changed(self, index: int):
+        """Queue a reasons rebuild for the newly selected horse."""
+        self._pending_reason_index = index
+        self._select_timer.start()
     
     def on_horse_selected(self, index: int):
         """Handle horse selection for detailed reasons."""
         if index < 0 or index >= len(self.predictions):
             return
         
+        text = self._reasons_cache.get(index)
+        if text is None:
+            text = self._build_reasons_text(index)
+            self._reasons_cache[index] = text
+        self.reasons_content.setPlainText(text)
+    
+    def _build_reasons_text(self, index: int) -> str:
+        """Build the detailed reasons text for one prediction."""
         pred = self.predictions[index]
-        reasons = pred.get('detailed_reasons', {})
-        
-        # Build detailed text
-        text = []
-        text.append("=" * 60)
-        text.append(f"預測 #{index + 1}: {pred.get('horse_name', '未知').upper()}")
-        text.append("=" * 60)
-        text.append("")
-        
-        # Basic info
-        text.append("基本資訊")
-        text.append("-" * 40)
-        text.append(f"馬匹編號: {pred.get('horse_number', 'N/A')}")
-        text.append(f"騎師: {pred.get('jockey', 'N/A')}")
-        text.append(f"練馬師: {pred.get('trainer', 'N/A')}")
-        text.append(f"負磅: {pred.get('weight', 'N/A')}")
-        text.append(f"檔位: {pred.get('draw', 'N/A')}")
-        text.append("")
-        
-        # Prediction metrics
-        text.append("預測指標")
-        text.append("-" * 40)
-        text.append(f"勝出機率: {pred.get('win_probability', 0):.2f}%")
-        text.append(f"位置機率: {pred.get('place_probability', 0):.2f}%")
-        text.append(f"信心度: {pred.get('confidence', 0) * 100:.0f}%")
-        
-        odds = pred.get('current_odds')
+        g = pred.get
+        reasons = g('detailed_reasons', {})
+        
+        text = [
+            _SEP60,
+            f"預測 #{index + 1}: {g('horse_name', '未知').upper()}",
+            _SEP60,
+            "",
+            # Basic info
+            "基本資訊",
+            _SEP40,
+            f"馬匹編號: {g('horse_number', 'N/A')}",
+            f"騎師: {g('jockey', 'N/A')}",
+            f"練馬師: {g('trainer', 'N/A')}",
+            f"負磅: {g('weight', 'N/A')}",
+            f"檔位: {g('draw', 'N/A')}",
+            "",
+            # Prediction metrics
+            "預測指標",
+            _SEP40,
+            f"勝出機率: {g('win_probability', 0):.2f}%",
+            f"位置機率: {g('place_probability', 0):.2f}%",
+            f"信心度: {g('confidence', 0) * 100:.0f}%",
+        ]
+        
+        odds = g('current_odds')
         if odds and odds > 0:
             text.append(f"現時賠率: {odds:.1f}")
         
-        value = pred.get('value_pct')
+        value = g('value_pct')
         if value is not None:
             text.append(f"價值: {value:+.1f}%")
         
-        text.append("")
-        
         # Risk assessment
-        text.append("風險評估")
-        text.append("-" * 40)
-        text.append(f"風險評分: {pred.get('risk_score', 0):.0f}/100")
-        text.append(f"建議: {pred.get('risk_recommendation', 'N/A')}")
-        text.append("")
+        text += [
+            "",
+            "風險評估",
+            _SEP40,
+            f"風險評分: {g('risk_score', 0):.0f}/100",
+            f"建議: {g('risk_recommendation', 'N/A')}",
+            "",
+        ]
         
         # Positive factors
         positive = reasons.get('positive_factors', [])
         if positive:
-            text.append("✓ 正面因素")
-            text.append("-" * 40)
-            for factor in positive:
-                text.append(f"  • {factor}")
+            text += ["✓ 正面因素", _SEP40]
+            text.extend(f"  • {factor}" for factor in positive)
             text.append("")
         
         # Negative factors
         negative = reasons.get('negative_factors', [])
         if negative:
-            text.append("✗ 負面因素")
-            text.append("-" * 40)
-            for factor in negative:
-                text.append(f"  • {factor}")
+            text += ["✗ 負面因素", _SEP40]
+            text.extend(f"  • {factor}" for factor in negative)
             text.append("")
         
         # Key statistics
         stats = reasons.get('key_statistics', [])
         if stats:
-            text.append("關鍵統計")
-            text.append("-" * 40)
-            for stat in stats:
-                text.append(f"  • {stat}")
+            text += ["關鍵統計", _SEP40]
+            text.extend(f"  • {stat}" for stat in stats)
             text.append("")
         
         # Prediction summary
         summary = reasons.get('prediction_summary', '')
         if summary:
-            text.append("預測摘要")
-            text.append("-" * 40)
-            text.append(f"  {summary}")
-            text.append("")
+            text += ["預測摘要", _SEP40, f"  {summary}", ""]
         
         # Form score
-        form_score = pred.get('form_score', 0)
+        form_score = g('form_score', 0)
         if form_score > 0:
-            text.append("形勢分析")
-            text.append("-" * 40)
-            text.append(f"形勢評分: {form_score:.0f}%")
-            text.append("")
+            text += ["形勢分析", _SEP40, f"形勢評分: {form_score:.0f}%", ""]
         
         # Interaction multiplier
-        interaction = pred.get('interaction_multiplier', 1)
+        interaction = g('interaction_multiplier', 1)
         if interaction != 1:
-            text.append("因素互動")
-            text.append("-" * 40)
-            text.append(f"綜合倍數: {interaction:.2f}x")
-            text.append("")
+            text += ["因素互動", _SEP40, f"綜合倍數: {interaction:.2f}x", ""]
         
-        self.reasons_content.setText('\n'.join(text))
+        return '\n'.join(text)
     
     def update_race_info(self):
         """Update race information in the analysis tab."""
+        if not self._analysis_built:
+            return
+        
         info = self.race_info
         
         # Update labels
-        for child in self.findChildren(QLabel):
-            obj_name = child.objectName()
-            if obj_name in info:
-                child.setText(str(info[obj_name]))
+        for key, lbl in self._info_labels.items():
+            if key in info:
+                lbl.setText(str(info[key]))
         
         # Update field size
         field_size = info.get('field_size', len(self.predictions))
-        for child in self.findChildren(QLabel):
-            if child.objectName() == 'field_size':
-                child.setText(str(field_size))
+        self._info_labels['field_size'].setText(str(field_size))
         
         # Update model info
         if hasattr(self, 'result'):
             model_info = self.result.get('analysis', '')
             if model_info:
                 self.model_info.setText(f"模型: 增強版 v2.0\n校準: 冪律\n特徵: 100+\n\n{model_info}")
-
-
-import os
@@ -3,22 +3,152 @@
 """
 
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
-    QScrollArea, QFrame, QPushButton, QTabWidget, QWidget, QTextEdit
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTableView,
+    QScrollArea, QFrame, QPushButton, QTabWidget, QWidget, QTextEdit, QHeaderView
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QColor
-import sqlite3
+from PyQt5.QtCore import (
+    Qt, QObject, QThreadPool, pyqtSignal, QAbstractTableModel, QModelIndex
+)
+from PyQt5.QtGui import QFont
+from . import db_pool
+from .runnables import OwnedRunnable
+from .styles import TABLE_COLORS
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+import logging
+import os
+import sys
+import threading
+import time
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 設定 RACING_DEBUG 時在錯誤訊息中附上完整 traceback
+_DEBUG = bool(os.environ.get('RACING_DEBUG'))
+
+# 修復導入路徑以匹配您的項目結構（只做一次）
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_DIR not in sys.path:
+    sys.path.insert(0, _PROJECT_DIR)
+
+# 使用您的實際數據庫路徑
+_DB_PATH = os.path.join(_PROJECT_DIR, 'database', 'hkjc_races.db')
+
+
+# Accuracy category -> TABLE_COLORS key
+_ACCURACY_COLOR_KEYS = {'perfect': 'green', 'good': 'amber', 'poor': 'red', 'na': 'gray'}
+
+# Category order behind DerivedArrays.accuracy_key_idx
+_ACCURACY_KEYS = ('perfect', 'good', 'poor', 'na')
+
+# Per-row prediction fields read by the table builders, with their defaults
+_PRED_ROW_DEFAULTS = {
+    'horse_name': '',
+    'win_probability': 0,
+    'confidence': 0,
+    'value_pct': None,
+    'current_odds': None,
+}
+_pred_row_fields = itemgetter(*_PRED_ROW_DEFAULTS)
+
+# Fixed column widths (column 1 is the horse name and stretches)
+_PRED_COLUMN_WIDTHS = (60, 180, 90, 90, 90, 90)
+_CMP_COLUMN_WIDTHS = (90, 180, 90, 90, 90, 80, 80)
+_NAME_COLUMN = 1
+
+
+def _as_position(value) -> int:
+    """Finishing position as an int; 0 for non-finishers such as WV"""
+    if isinstance(value, int):
+        return value
+    # Text positions look like "3 平頭馬" (dead heat) or carry trailing junk
+    token = str(value or '').split(maxsplit=1)[:1]
+    return int(token[0]) if token and token[0].isdigit() else 0
+
+
+@dataclass
+class DerivedArrays:
+    """Per-row comparison data shared by the comparison table and accuracy stats"""
+    ranks: np.ndarray
+    actuals: np.ndarray  # 0 for horses without a finishing position
+    diffs: np.ndarray  # predicted rank - actual position, 0 when unfinished
+    abs_diffs: np.ndarray
+    finished_mask: np.ndarray
+    perfect_mask: np.ndarray
+    good_mask: np.ndarray
+    top3_mask: np.ndarray
+    accuracy_key_idx: np.ndarray  # index into _ACCURACY_KEYS
+
+
+def _fuse_derivations(pred_list, actual_results) -> DerivedArrays:
+    """Look up each horse's result once and derive every comparison array from it"""
+    count = len(pred_list)
+    ranks = np.arange(1, count + 1, dtype=np.int16)
+    actuals = np.fromiter(
+        (actual_results.get(pred.get('horse_name', '')) or 0 for pred in pred_list),
+        dtype=np.int16, count=count)
+    finished = actuals > 0
+    diffs = np.where(finished, ranks - actuals, 0)
+    abs_diffs = np.abs(diffs)
+    perfect = finished & (abs_diffs == 0)
+    good = finished & (abs_diffs > 0) & (abs_diffs <= 2)
+    top3 = finished & (ranks <= 3) & (actuals <= 3)
+    key_idx = np.select([~finished, perfect, good], [3, 0, 1], default=2)
+    return DerivedArrays(ranks, actuals, diffs, abs_diffs, finished,
+                         perfect, good, top3, key_idx)
+
+
+# predict_race shares analyzer state, so callers hold this while predicting
+_predictor_lock = threading.Lock()
+
+
+@lru_cache(maxsize=2)
+def _get_predictor(db_path: str):
+    """Shared EnhancedRacePredictor per database, built on first use"""
+    from engine.prediction.enhanced_predictor import EnhancedRacePredictor
+    return EnhancedRacePredictor(db_path)
 
 
-class LiveOddsRefreshWorker(QThread):
-    """背景工作進程用於刷新即時賠率"""
+# (normalized race_date, race_number) -> racecourse, filled on first lookup
+_racecourse_cache = {}
+
+# First non-empty racecourse in future_race_cards, then fixtures, then race_results.
+# Only future_race_cards stores timestamps in race_date; the other tables hold
+# plain YYYY-MM-DD dates and are matched exactly so their indexes can be used.
+_RACECOURSE_SQL = """
+    SELECT racecourse FROM (
+        SELECT 1 AS src, racecourse FROM future_race_cards
+        WHERE race_date LIKE ? AND race_number = ? AND racecourse <> ''
+        UNION ALL
+        SELECT 2, racecourse FROM fixtures
+        WHERE race_date = ? AND race_number = ? AND racecourse <> ''
+        UNION ALL
+        SELECT 3, racecourse FROM race_results
+        WHERE race_date = ? AND race_number = ? AND racecourse <> ''
+    )
+    ORDER BY src
+    LIMIT 1
+"""
+
+# (date, race_number, racecourse, race fingerprint) -> (cached at, predict_race result)
+_prediction_cache = {}
+_PREDICTION_CACHE_SIZE = 32
+_PREDICTION_TTL = 300  # seconds
+
+
+class _OddsRefreshSignals(QObject):
     refresh_complete = pyqtSignal(int)
     error = pyqtSignal(str)
+
+
+class LiveOddsRefreshWorker(OwnedRunnable):
+    """在共用線程池中刷新即時賠率"""
     
     def __init__(self, race_date: str, race_number: int, racecourse: str):
-        super().__init__()
+        super().__init__(_OddsRefreshSignals())
         self.race_date = race_date
         self.race_number = race_number
         self.racecourse = racecourse
@@ -26,15 +156,9 @@ class LiveOddsRefreshWorker(QThread):
     def run(self):
         """抓取並保存最新賠率"""
         try:
-            import sys
-            import os
-            parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            sys.path.insert(0, parent_dir)
-            
             from scraper.pipeline import HKJCDataPipeline
             
-            db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database', 'hkjc_races.db')
-            pipeline = HKJCDataPipeline(db_path)
+            pipeline = HKJCDataPipeline(_DB_PATH)
             
             # 標準化日期
             normalized_date = self.race_date
@@ -42,106 +166,88 @@ class LiveOddsRefreshWorker(QThread):
                 normalized_date = str(self.race_date).split(' ')[0]
                 
             count = pipeline.save_live_odds(normalized_date, self.race_number, self.racecourse)
-            self.refresh_complete.emit(count)
+            self.signals.refresh_complete.emit(count)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
-class PredictionLoaderWorker(QThread):
-    """背景工作進程用於加載預測"""
+class _PredictionLoaderSignals(QObject):
     predictions_loaded = pyqtSignal(dict)
     error = pyqtSignal(str)
+
+
+class PredictionLoaderWorker(OwnedRunnable):
+    """在共用線程池中加載預測"""
     
     def __init__(self, race_date: str, race_number: int):
-        super().__init__()
+        super().__init__(_PredictionLoaderSignals())
         self.race_date = race_date
         self.race_number = race_number
     
+    @classmethod
+    def invalidate(cls, race_date: str, race_number: int):
+        """Forget the cached racecourse for a race"""
+        _racecourse_cache.pop((str(race_date).split(' ')[0], race_number), None)
+    
     def run(self):
         """加載預測和實際結果"""
         try:
-            import sys
-            import os
-            
-            # 修復導入路徑以匹配您的項目結構
-            parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            sys.path.insert(0, parent_dir)
-            
-            from engine.prediction.enhanced_predictor import EnhancedRacePredictor
-            
-            # 使用您的實際數據庫路徑
-            db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database', 'hkjc_races.db')
-            
+            db_path = _DB_PATH
             if not os.path.exists(db_path):
-                self.error.emit(f"數據庫未找到: {db_path}")
+                self.signals.error.emit(f"數據庫未找到: {db_path}")
                 return
             
-            predictor = EnhancedRacePredictor(db_path)
-            
             # 標準化日期
             normalized_date = self.race_date
             if ' ' in str(self.race_date):
                 normalized_date = str(self.race_date).split(' ')[0]
             
             # 獲取賽道信息
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            # Try future_race_cards, then fixtures, then race_results
-            racecourse = None
-            
-            # 1. future_race_cards
-            cursor.execute("""
-                SELECT DISTINCT racecourse FROM future_race_cards
-                WHERE race_date LIKE ? AND race_number = ?
-                LIMIT 1
-            """, (f"{normalized_date}%", self.race_number))
-            row = cursor.fetchone()
-            if row:
-                racecourse = row['racecourse']
-            
-            # 2. fixtures
-            if not racecourse:
-                cursor.execute("""
-                    SELECT racecourse FROM fixtures
-                    WHERE race_date LIKE ? AND race_number = ?
-                    LIMIT 1
-                """, (f"{normalized_date}%", self.race_number))
-                row = cursor.fetchone()
-                if row:
-                    racecourse = row['racecourse']
-            
-            # 3. race_results
-            if not racecourse:
+            with db_pool.acquire(db_path) as conn:
+                cursor = conn.cursor()
+                
+                # 賽道很少變動，命中快取時跳過查詢
+                cache_key = (normalized_date, self.race_number)
+                racecourse = _racecourse_cache.get(cache_key)
+                if not racecourse:
+                    cursor.execute(_RACECOURSE_SQL, (
+                        f"{normalized_date}%", self.race_number,
+                        normalized_date, self.race_number,
+                        normalized_date, self.race_number,
+                    ))
+                    row = cursor.fetchone()
+                    if row:
+                        racecourse = row['racecourse']
+                        _racecourse_cache[cache_key] = racecourse
+                
+                if not racecourse:
+                    # Default to ST if not found
+                    racecourse = 'ST'
+                
+                # 生成預測；賽事資料及賠率未變且未過期時沿用上次結果
+                prediction_key = (normalized_date, self.race_number, racecourse,
+                                  db_pool.race_fingerprint(conn, normalized_date,
+                                                           self.race_number, racecourse))
+                cached = _prediction_cache.get(prediction_key)
+                if cached and time.time() - cached[0] < _PREDICTION_TTL:
+                    predictions = cached[1]
+                else:
+                    with _predictor_lock:
+                        predictions = _get_predictor(db_path).predict_race(
+                            normalized_date, self.race_number, racecourse)
+                        if 'error' not in predictions:
+                            _prediction_cache.pop(prediction_key, None)
+                            if len(_prediction_cache) >= _PREDICTION_CACHE_SIZE:
+                                del _prediction_cache[next(iter(_prediction_cache))]
+                            _prediction_cache[prediction_key] = (time.time(), predictions)
+                
+                # 獲取實際結果用於比較（按馬名匹配）
                 cursor.execute("""
-                    SELECT racecourse FROM race_results
-                    WHERE race_date LIKE ? AND race_number = ?
-                    LIMIT 1
-                """, (f"{normalized_date}%", self.race_number))
-                row = cursor.fetchone()
-                if row:
-                    racecourse = row['racecourse']
-            
-            if not racecourse:
-                # Default to ST if not found
-                racecourse = 'ST'
-            
-            # 生成預測
-            predictions = predictor.predict_race(normalized_date, self.race_number, racecourse)
-            
-            # 獲取實際結果用於比較（按馬名匹配）
-            cursor.execute("""
-                SELECT horse_name, position FROM race_results
-                WHERE race_date = ? AND race_number = ? AND racecourse = ?
-                ORDER BY position
-            """, (normalized_date, self.race_number, racecourse))
-            
-            results_rows = cursor.fetchall()
-            actual_results = {row['horse_name']: row['position'] for row in results_rows}
-            has_history = len(actual_results) > 0
-            
-            conn.close()
+                    SELECT horse_name, position FROM race_results
+                    WHERE race_date = ? AND race_number = ? AND racecourse = ?
+                """, (normalized_date, self.race_number, racecourse))
+                actual_results = {name: _as_position(pos) for name, pos in cursor.fetchall()}
+                has_history = len(actual_results) > 0
             
             result_data = {
                 'race_date': normalized_date,
@@ -152,12 +258,47 @@ class PredictionLoaderWorker(QThread):
                 'has_history': has_history
             }
             
-            self.predictions_loaded.emit(result_data)
+            self.signals.predictions_loaded.emit(result_data)
             
         except Exception as e:
-            import traceback
-            error_msg = f"加載預測失敗: {str(e)}\n{traceback.format_exc()}"
-            self.error.emit(error_msg)
+            # 完整 traceback 寫入日誌，只在除錯模式下隨訊號傳給介面
+            logger.exception("Failed to load predictions for race %s on %s",
+                             self.race_number, self.race_date)
+            error_msg = f"加載預測失敗: {str(e)}"
+            if _DEBUG:
+                import traceback
+                error_msg += f"\n{traceback.format_exc()}"
+            self.signals.error.emit(error_msg)
+
+
+class PredictionTableModel(QAbstractTableModel):
+    """唯讀表格模型：每列文字與前景色分開存放"""
+    
+    def __init__(self, headers, rows, fg_colors, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = rows
+        self._fg_colors = fg_colors
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ForegroundRole:
+            return self._fg_colors[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
 
 
 class RacePredictionModal(QDialog):
@@ -177,6 +318,39 @@ class RacePredictionModal(QDialog):
     
     def init_ui(self):
         """初始化UI"""
+        # 表格用的翻譯字串只查一次
+        self._pred_headers = [self.tr("排名"), self.tr("馬名"), self.tr("勝率%"), self.tr("信心%"), self.tr("值博%"), self.tr("賠率")]
+        self._cmp_headers = [self.tr("預測排名"), self.tr("馬名"), self.tr("勝率%"), self.tr("信心%"), self.tr("實際名次"), self.tr("名次差"), self.tr("準確度")]
+        self._accuracy_labels = {
+            'perfect': self.tr("完美"),
+            'good': self.tr("良好"),
+            'poor': self.tr("差"),
+            'na': self.tr("N/A"),
+        }
+        # 按 _ACCURACY_KEYS 順序的 (標籤, 顏色)
+        self._accuracy_cells = tuple(
+            (self._accuracy_labels[key], TABLE_COLORS[_ACCURACY_COLOR_KEYS[key]])
+            for key in _ACCURACY_KEYS)
+        self._position_fmt = self.tr("名次 {}")
+        self._unfinished_label = self.tr("未完成")
+        # 準確度總結模板；語言可在執行時切換，所以按實例翻譯
+        self._stats_template = self.tr("""
+        預測準確度總結
+        {sep}
+
+        總馬匹數: {total}
+        完美預測（準確名次）: {perfect} ({perfect_pct}%)
+        良好預測（相差2名以內）: {good} ({good_pct}%)
+        冠軍預測正確: {winner}
+        前三名準確度: {top3}/3 ({top3_pct}%)
+        平均名次差: {avg} 名
+
+        準確度分類:
+        • 完美: 完全預測到最終名次
+        • 良好: 預測名次與實際相差2名以內
+        • 差: 預測名次與實際相差3名或以上
+        """)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(16)
@@ -249,6 +423,10 @@ class RacePredictionModal(QDialog):
             }
         """)
         reasoning_layout.addWidget(self.reasoning_text)
+        # 推理文本在首次打開該標籤頁時才建立
+        self._reasoning_preds = None
+        self._reasoning_built = False
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # 關閉按鈕
         footer_layout = QHBoxLayout()
@@ -274,9 +452,9 @@ class RacePredictionModal(QDialog):
     def load_predictions(self):
         """在背景中加載預測"""
         self.worker = PredictionLoaderWorker(self.race_date, self.race_number)
-        self.worker.predictions_loaded.connect(self._on_predictions_loaded)
-        self.worker.error.connect(self._on_error)
-        self.worker.start()
+        self.worker.signals.predictions_loaded.connect(self._on_predictions_loaded)
+        self.worker.signals.error.connect(self._on_error)
+        QThreadPool.globalInstance().start(self.worker)
     
     def refresh_live_odds(self):
         """Trigger live odds refresh using Selenium"""
@@ -289,14 +467,18 @@ class RacePredictionModal(QDialog):
         racecourse = getattr(self, 'racecourse', 'ST')
         
         self.refresh_worker = LiveOddsRefreshWorker(self.race_date, self.race_number, racecourse)
-        self.refresh_worker.refresh_complete.connect(self._on_refresh_complete)
-        self.refresh_worker.error.connect(self._on_error)
-        self.refresh_worker.start()
+        self.refresh_worker.signals.refresh_complete.connect(self._on_refresh_complete)
+        self.refresh_worker.signals.error.connect(self._on_error)
+        QThreadPool.globalInstance().start(self.refresh_worker)
         
     def _on_refresh_complete(self, count):
         """Called when odds refresh is complete"""
         self.refresh_btn.setEnabled(True)
         self.refresh_btn.setText(self.tr("刷新賠率"))
+        if count == 0:
+            # Nothing new was saved, so the current predictions still stand
+            self.info_label.setText(self.tr("沒有新的賠率"))
+            return
         self.info_label.setText(self.tr("賠率更新成功（{} 條記錄）。正在重新計算預測...").format(count))
         # Reload predictions with new odds
         self.load_predictions()
@@ -325,107 +507,145 @@ class RacePredictionModal(QDialog):
         pred_list = predictions.get('predictions', [])
         
         if self.has_history:
-            self._setup_comparison_view(pred_list, actual_results)
+            derived = _fuse_derivations(pred_list, actual_results)
+            self._setup_comparison_view(pred_list, derived)
         else:
             self._setup_prediction_reasoning_view(pred_list)
     
     def _setup_prediction_reasoning_view(self, pred_list):
         """顯示未來賽事的詳細預測推理"""
-        self.tabs.clear()
-        
-        # 標籤頁1: 預測表格
-        predictions_table = QTableWidget()
-        predictions_table.setColumnCount(6)
-        predictions_table.setHorizontalHeaderLabels([self.tr("排名"), self.tr("馬名"), self.tr("勝率%"), self.tr("信心%"), self.tr("值博%"), self.tr("賠率")])
-        predictions_table.setRowCount(len(pred_list))
-        predictions_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #0f172a;
-                border: 1px solid #334155;
-                gridline-color: #334155;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                color: #f8fafc;
-            }
-            QHeaderView::section {
-                background-color: #1e293b;
-                color: #f8fafc;
-                padding: 8px;
-                font-weight: 600;
-            }
-        """)
-        
-        for row_idx, pred in enumerate(pred_list):
-            # 排名
-            rank = QTableWidgetItem(str(row_idx + 1))
-            rank.setForeground(QColor("#cbd5e1"))
-            predictions_table.setItem(row_idx, 0, rank)
-            
-            # 馬名
-            horse_name = QTableWidgetItem(pred.get('horse_name', ''))
-            horse_name.setForeground(QColor("#f8fafc"))
-            predictions_table.setItem(row_idx, 1, horse_name)
-            
-            # 勝率
-            win_prob = pred.get('win_probability', 0)
-            win_prob_item = QTableWidgetItem(f"{win_prob:.1f}%")
-            win_prob_item.setForeground(QColor("#10b981") if win_prob > 15 else QColor("#94a3b8"))
-            predictions_table.setItem(row_idx, 2, win_prob_item)
-            
-            # 信心
-            confidence = pred.get('confidence', 0) * 100
-            confidence_item = QTableWidgetItem(f"{confidence:.1f}%")
-            confidence_item.setForeground(QColor("#3b82f6"))
-            predictions_table.setItem(row_idx, 3, confidence_item)
-            
-            # 值博
-            value_pct = pred.get('value_pct', None)
-            if value_pct is not None:
-                value_item = QTableWidgetItem(f"{value_pct:+.0f}%")
-                if value_pct > 10:
-                    value_item.setForeground(QColor("#10b981"))  # 好值博
-                elif value_pct < -10:
-                    value_item.setForeground(QColor("#ef4444"))  # 差值博
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            self.tabs.clear()
+            
+            # 標籤頁1: 預測表格
+            na = self._accuracy_labels['na']
+            rows = []
+            fg_colors = []
+            for row_idx, pred in enumerate(pred_list):
+                horse_name, win_prob, confidence, value_pct, odds = _pred_row_fields(
+                    {**_PRED_ROW_DEFAULTS, **pred})
+                confidence *= 100
+                
+                # 值博
+                if value_pct is not None:
+                    value_text = f"{value_pct:+.0f}%"
+                    if value_pct > 10:
+                        value_fg = TABLE_COLORS['green']  # 好值博
+                    elif value_pct < -10:
+                        value_fg = TABLE_COLORS['red']  # 差值博
+                    else:
+                        value_fg = TABLE_COLORS['muted']  # 中性
                 else:
-                    value_item.setForeground(QColor("#94a3b8"))  # 中性
-            else:
-                value_item = QTableWidgetItem(self.tr("N/A"))
-                value_item.setForeground(QColor("#6b7280"))  # 灰色
-            predictions_table.setItem(row_idx, 4, value_item)
-            
-            # 賠率
-            odds = pred.get('current_odds', None)
-            if odds is not None and odds > 0:
-                odds_item = QTableWidgetItem(f"{odds:.1f}")
-            else:
-                odds_item = QTableWidgetItem(self.tr("N/A"))
-            odds_item.setForeground(QColor("#cbd5e1"))
-            predictions_table.setItem(row_idx, 5, odds_item)
-        
-        predictions_table.resizeColumnsToContents()
-        self.tabs.addTab(predictions_table, self.tr("預測"))
-
-        # 標籤頁2: 詳細推理
-        self._build_reasoning_text(pred_list)
-        self.tabs.addTab(self.reasoning_widget, self.tr("預測推理"))
+                    value_text = na
+                    value_fg = TABLE_COLORS['gray']  # 灰色
+                
+                # 賠率
+                odds_text = f"{odds:.1f}" if odds is not None and odds > 0 else na
+                
+                rows.append((
+                    str(row_idx + 1),
+                    horse_name,
+                    f"{win_prob:.1f}%",
+                    f"{confidence:.1f}%",
+                    value_text,
+                    odds_text,
+                ))
+                fg_colors.append((
+                    TABLE_COLORS['sub'],
+                    TABLE_COLORS['text'],
+                    TABLE_COLORS['green'] if win_prob > 15 else TABLE_COLORS['muted'],
+                    TABLE_COLORS['blue'],
+                    value_fg,
+                    TABLE_COLORS['sub'],
+                ))
+            
+            predictions_table = self._create_table_view(
+                PredictionTableModel(self._pred_headers, rows, fg_colors), _PRED_COLUMN_WIDTHS)
+            self.tabs.addTab(predictions_table, self.tr("預測"))
+            
+            # 標籤頁2: 詳細推理（延遲到首次選中時建立）
+            self._reasoning_preds = pred_list
+            self._reasoning_built = False
+            self.reasoning_text.clear()
+            self.tabs.addTab(self.reasoning_widget, self.tr("預測推理"))
+        finally:
+            self.tabs.setUpdatesEnabled(True)
     
-    def _setup_comparison_view(self, pred_list, actual_results):
+    def _setup_comparison_view(self, pred_list, derived):
         """顯示有結果賽事的比較"""
-        self.tabs.clear()
-        
-        # 標籤頁1: 比較表格
-        comparison_table = QTableWidget()
-        comparison_table.setColumnCount(7)
-        comparison_table.setHorizontalHeaderLabels([self.tr("預測排名"), self.tr("馬名"), self.tr("勝率%"), self.tr("信心%"), self.tr("實際名次"), self.tr("名次差"), self.tr("準確度")])
-        comparison_table.setRowCount(len(pred_list))
-        comparison_table.setStyleSheet("""
-            QTableWidget {
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            self.tabs.clear()
+            
+            # 標籤頁1: 比較表格
+            na_label = self._accuracy_labels['na']
+            accuracy_cells = self._accuracy_cells
+            rows = []
+            fg_colors = []
+            for pred, pred_rank, actual_pos, pos_diff, key_idx in zip(
+                    pred_list, derived.ranks.tolist(), derived.actuals.tolist(),
+                    derived.diffs.tolist(), derived.accuracy_key_idx.tolist()):
+                horse_name, win_prob, confidence, _, _ = _pred_row_fields(
+                    {**_PRED_ROW_DEFAULTS, **pred})
+                confidence *= 100
+                
+                # 實際名次
+                if actual_pos:
+                    actual_text = self._position_fmt.format(actual_pos)
+                    if actual_pos == 1:
+                        actual_fg = TABLE_COLORS['green']  # 冠軍
+                    elif actual_pos <= 3:
+                        actual_fg = TABLE_COLORS['amber']  # 前三名
+                    else:
+                        actual_fg = TABLE_COLORS['muted']  # 其他
+                else:
+                    actual_text = self._unfinished_label
+                    actual_fg = TABLE_COLORS['red']
+                
+                # 名次差與準確度同色（完美/接近/偏差大/無結果）
+                accuracy_text, accuracy_fg = accuracy_cells[key_idx]
+                diff_text = f"{pos_diff:+d}" if actual_pos else na_label
+                
+                rows.append((
+                    str(pred_rank),
+                    horse_name,
+                    f"{win_prob:.1f}%",
+                    f"{confidence:.1f}%",
+                    actual_text,
+                    diff_text,
+                    accuracy_text,
+                ))
+                fg_colors.append((
+                    TABLE_COLORS['sub'],
+                    TABLE_COLORS['text'],
+                    TABLE_COLORS['green'] if win_prob > 15 else TABLE_COLORS['muted'],
+                    TABLE_COLORS['blue'],
+                    actual_fg,
+                    accuracy_fg,
+                    accuracy_fg,
+                ))
+            
+            comparison_table = self._create_table_view(
+                PredictionTableModel(self._cmp_headers, rows, fg_colors), _CMP_COLUMN_WIDTHS)
+            self.tabs.addTab(comparison_table, self.tr("比較"))
+            
+            # 標籤頁2: 準確度總結
+            accuracy_stats = self._calculate_accuracy_stats(derived)
+            self._setup_accuracy_summary_tab(accuracy_stats)
+        finally:
+            self.tabs.setUpdatesEnabled(True)
+    
+    def _create_table_view(self, model, column_widths):
+        """建立套用共用樣式的唯讀表格"""
+        table = QTableView()
+        table.setStyleSheet("""
+            QTableView {
                 background-color: #0f172a;
                 border: 1px solid #334155;
                 gridline-color: #334155;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 color: #f8fafc;
             }
@@ -436,186 +656,101 @@ class RacePredictionModal(QDialog):
                 font-weight: 600;
             }
         """)
-        
-        for row_idx, pred in enumerate(pred_list):
-            pred_rank = row_idx + 1
-            horse_name = pred.get('horse_name', '')
-            actual_pos = actual_results.get(horse_name)
-            pos_diff = (pred_rank - actual_pos) if actual_pos else None
-            
-            # 預測排名
-            rank_item = QTableWidgetItem(str(pred_rank))
-            rank_item.setForeground(QColor("#cbd5e1"))
-            comparison_table.setItem(row_idx, 0, rank_item)
-            
-            # 馬名
-            horse_item = QTableWidgetItem(horse_name)
-            horse_item.setForeground(QColor("#f8fafc"))
-            comparison_table.setItem(row_idx, 1, horse_item)
-            
-            # 勝率
-            win_prob = pred.get('win_probability', 0)
-            win_prob_item = QTableWidgetItem(f"{win_prob:.1f}%")
-            win_prob_item.setForeground(QColor("#10b981") if win_prob > 15 else QColor("#94a3b8"))
-            comparison_table.setItem(row_idx, 2, win_prob_item)
-            
-            # 信心
-            confidence = pred.get('confidence', 0) * 100
-            confidence_item = QTableWidgetItem(f"{confidence:.1f}%")
-            confidence_item.setForeground(QColor("#3b82f6"))
-            comparison_table.setItem(row_idx, 3, confidence_item)
-            
-            # 實際名次
-            if actual_pos:
-                actual_item = QTableWidgetItem(self.tr("名次 {}").format(actual_pos))
-                if actual_pos == 1:
-                    actual_item.setForeground(QColor("#10b981"))  # 冠軍
-                elif actual_pos <= 3:
-                    actual_item.setForeground(QColor("#f59e0b"))  # 前三名
-                else:
-                    actual_item.setForeground(QColor("#94a3b8"))  # 其他
-            else:
-                actual_item = QTableWidgetItem(self.tr("未完成"))
-                actual_item.setForeground(QColor("#ef4444"))
-            comparison_table.setItem(row_idx, 4, actual_item)
-            
-            # 名次差
-            if pos_diff is not None:
-                diff_item = QTableWidgetItem(f"{pos_diff:+d}")
-                if abs(pos_diff) == 0:
-                    diff_item.setForeground(QColor("#10b981"))  # 完美
-                elif abs(pos_diff) <= 2:
-                    diff_item.setForeground(QColor("#f59e0b"))  # 接近
-                else:
-                    diff_item.setForeground(QColor("#ef4444"))  # 偏差大
-            else:
-                diff_item = QTableWidgetItem(self.tr("N/A"))
-                diff_item.setForeground(QColor("#6b7280"))
-            comparison_table.setItem(row_idx, 5, diff_item)
-            
-            # 準確度
-            accuracy_key = self._get_accuracy_label(pos_diff)
-            accuracy_item = QTableWidgetItem(self.tr(accuracy_key))
-            if accuracy_key == "完美":
-                accuracy_item.setForeground(QColor("#10b981"))
-            elif accuracy_key == "良好":
-                accuracy_item.setForeground(QColor("#f59e0b"))
-            elif accuracy_key == "差":
-                accuracy_item.setForeground(QColor("#ef4444"))
-            else:
-                accuracy_item.setForeground(QColor("#6b7280"))
-            comparison_table.setItem(row_idx, 6, accuracy_item)
-        
-        comparison_table.resizeColumnsToContents()
-        self.tabs.addTab(comparison_table, self.tr("比較"))
-        
-        # 標籤頁2: 準確度總結
-        accuracy_stats = self._calculate_accuracy_stats(pred_list, actual_results)
-        self._setup_accuracy_summary_tab(accuracy_stats)
+        # The model is parented to the view so it is freed with its tab
+        model.setParent(table)
+        table.setModel(model)
+        # Column contents are regular, so fixed widths replace resizeColumnsToContents
+        h_header = table.horizontalHeader()
+        h_header.setSectionResizeMode(QHeaderView.Fixed)
+        for col, width in enumerate(column_widths):
+            table.setColumnWidth(col, width)
+        h_header.setSectionResizeMode(_NAME_COLUMN, QHeaderView.Stretch)
+        return table
+    
+    def _on_tab_changed(self, index):
+        """首次切換到推理標籤頁時才建立推理文本"""
+        if (self._reasoning_built or self._reasoning_preds is None
+                or self.tabs.widget(index) is not self.reasoning_widget):
+            return
+        self._reasoning_built = True
+        self._build_reasoning_text(self._reasoning_preds)
     
     def _build_reasoning_text(self, pred_list):
         """為預測建立詳細的推理文本"""
-        reasoning = ""
+        self.reasoning_text.setText("".join(
+            self._format_horse_block(idx, pred)
+            for idx, pred in enumerate(pred_list[:5], 1)  # 前5名馬匹
+        ))
+    
+    def _format_horse_block(self, idx, pred):
+        """單匹馬的推理段落"""
+        parts = []
+        
+        parts.append(f"\n{'='*80}\n")
+        parts.append(f"{self.tr('排名')} {idx}: {pred.get('horse_name', '未知').upper()}\n")
+        parts.append(f"{'='*80}\n\n")
+        
+        # 基本預測信息
+        parts.append(f"{self.tr('勝率')}: {pred.get('win_probability', 0):.1f}%\n")
+        parts.append(f"{self.tr('信心評分')}: {pred.get('confidence', 0)*100:.1f}%\n")
+        parts.append(f"{self.tr('風險評分')}: {pred.get('risk_score', 0):.1f}/100\n")
+        value_pct = pred.get('value_pct', None)
+        if value_pct is not None:
+            parts.append(f"{self.tr('值博')}: {value_pct:+.0f}%\n")
+        else:
+            parts.append(f"{self.tr('值博')}: {self.tr('N/A')}\n")
+        parts.append("\n")
+        
+        # 數學解釋
+        math_exp = pred.get('mathematical_explanation', {})
+        parts.append(f"{self.tr('數學分析')}:\n")
+        parts.append(f"  • {self.tr('原始概率')}: {math_exp.get('raw_probability', 0)*100:.1f}%\n")
+        parts.append(f"  • {self.tr('校準概率')}: {math_exp.get('calibrated_prob', 0)*100:.1f}%\n")
+        parts.append(f"  • {self.tr('校準調整')}: {math_exp.get('calibration_reduction', 0):.1f}%\n")
+        parts.append(f"  • {self.tr('交互乘數')}: {math_exp.get('interaction_multiplier', 1):.2f}x\n\n")
+        
+        # 基礎因素
+        base_factors = math_exp.get('base_factors', {})
+        if base_factors:
+            parts.append(f"{self.tr('基礎因素貢獻')}:\n")
+            for factor, value in base_factors.items():
+                parts.append(f"  • {factor.replace('_', ' ').title()}: {value*100:+.1f}%\n")
+            parts.append("\n")
+        
+        # 馬匹詳細信息
+        parts.append(f"{self.tr('馬匹詳細信息')}:\n")
+        parts.append(f"  • {self.tr('騎師')}: {pred.get('jockey', self.tr('N/A'))}\n")
+        parts.append(f"  • {self.tr('練馬師')}: {pred.get('trainer', self.tr('N/A'))}\n")
+        parts.append(f"  • {self.tr('負磅')}: {pred.get('weight', self.tr('N/A'))}\n")
+        parts.append(f"  • {self.tr('閘位')}: {pred.get('draw', self.tr('N/A'))}\n")
+        odds = pred.get('current_odds', None)
+        if odds is not None and odds > 0:
+            parts.append(f"  • {self.tr('當前賠率')}: {odds:.1f}\n")
+        else:
+            parts.append(f"  • {self.tr('當前賠率')}: {self.tr('N/A')}\n")
+        parts.append("\n")
         
-        for idx, pred in enumerate(pred_list[:5], 1):  # 前5名馬匹
-            reasoning += f"\n{'='*80}\n"
-            reasoning += f"{self.tr('排名')} {idx}: {pred.get('horse_name', '未知').upper()}\n"
-            reasoning += f"{'='*80}\n\n"
-            
-            # 基本預測信息
-            reasoning += f"{self.tr('勝率')}: {pred.get('win_probability', 0):.1f}%\n"
-            reasoning += f"{self.tr('信心評分')}: {pred.get('confidence', 0)*100:.1f}%\n"
-            reasoning += f"{self.tr('風險評分')}: {pred.get('risk_score', 0):.1f}/100\n"
-            value_pct = pred.get('value_pct', None)
-            if value_pct is not None:
-                reasoning += f"{self.tr('值博')}: {value_pct:+.0f}%\n"
-            else:
-                reasoning += f"{self.tr('值博')}: {self.tr('N/A')}\n"
-            reasoning += "\n"
-            
-            # 數學解釋
-            math_exp = pred.get('mathematical_explanation', {})
-            reasoning += f"{self.tr('數學分析')}:\n"
-            reasoning += f"  • {self.tr('原始概率')}: {math_exp.get('raw_probability', 0)*100:.1f}%\n"
-            reasoning += f"  • {self.tr('校準概率')}: {math_exp.get('calibrated_prob', 0)*100:.1f}%\n"
-            reasoning += f"  • {self.tr('校準調整')}: {math_exp.get('calibration_reduction', 0):.1f}%\n"
-            reasoning += f"  • {self.tr('交互乘數')}: {math_exp.get('interaction_multiplier', 1):.2f}x\n\n"
-            
-            # 基礎因素
-            base_factors = math_exp.get('base_factors', {})
-            if base_factors:
-                reasoning += f"{self.tr('基礎因素貢獻')}:\n"
-                for factor, value in base_factors.items():
-                    reasoning += f"  • {factor.replace('_', ' ').title()}: {value*100:+.1f}%\n"
-                reasoning += "\n"
-            
-            # 馬匹詳細信息
-            reasoning += f"{self.tr('馬匹詳細信息')}:\n"
-            reasoning += f"  • {self.tr('騎師')}: {pred.get('jockey', self.tr('N/A'))}\n"
-            reasoning += f"  • {self.tr('練馬師')}: {pred.get('trainer', self.tr('N/A'))}\n"
-            reasoning += f"  • {self.tr('負磅')}: {pred.get('weight', self.tr('N/A'))}\n"
-            reasoning += f"  • {self.tr('閘位')}: {pred.get('draw', self.tr('N/A'))}\n"
-            odds = pred.get('current_odds', None)
-            if odds is not None and odds > 0:
-                reasoning += f"  • {self.tr('當前賠率')}: {odds:.1f}\n"
-            else:
-                reasoning += f"  • {self.tr('當前賠率')}: {self.tr('N/A')}\n"
-            reasoning += "\n"
-            
-            # 風險評估
-            reasoning += f"{self.tr('風險評估')}: {pred.get('risk_recommendation', '評估')}\n"
-            reasoning += f"{self.tr('總體風險評分')}: {pred.get('risk_score', 0):.1f}/100\n\n"
+        # 風險評估
+        parts.append(f"{self.tr('風險評估')}: {pred.get('risk_recommendation', '評估')}\n")
+        parts.append(f"{self.tr('總體風險評分')}: {pred.get('risk_score', 0):.1f}/100\n\n")
         
-        self.reasoning_text.setText(reasoning)
+        return "".join(parts)
     
-    def _calculate_accuracy_stats(self, pred_list, actual_results):
+    def _calculate_accuracy_stats(self, derived):
         """計算預測準確度統計"""
-        stats = {
-            'total_horses': len(pred_list),
-            'perfect_predictions': 0,
-            'good_predictions': 0,
-            'winner_correct': False,
-            'top3_correct': 0,
-            'avg_position_diff': 0,
-            'position_diffs': []
+        # 只統計有實際名次的馬匹
+        finished = derived.finished_mask
+        abs_diffs = derived.abs_diffs[finished]
+        
+        return {
+            'total_horses': len(derived.ranks),
+            'perfect_predictions': int(derived.perfect_mask.sum()),
+            'good_predictions': int(derived.good_mask.sum()),
+            'winner_correct': bool(((derived.ranks == 1) & (derived.actuals == 1)).any()),
+            'top3_correct': int(derived.top3_mask.sum()),
+            'avg_position_diff': float(abs_diffs.mean()) if abs_diffs.size else 0,
+            'position_diffs': derived.diffs[finished].tolist()
         }
-        
-        for idx, pred in enumerate(pred_list):
-            pred_rank = idx + 1
-            horse_name = pred.get('horse_name', '')
-            actual_pos = actual_results.get(horse_name)
-            
-            if actual_pos:
-                pos_diff = pred_rank - actual_pos
-                stats['position_diffs'].append(pos_diff)
-                
-                if abs(pos_diff) == 0:
-                    stats['perfect_predictions'] += 1
-                elif abs(pos_diff) <= 2:
-                    stats['good_predictions'] += 1
-                
-                if pred_rank == 1 and actual_pos == 1:
-                    stats['winner_correct'] = True
-                
-                if pred_rank <= 3 and actual_pos <= 3:
-                    stats['top3_correct'] += 1
-        
-        if stats['position_diffs']:
-            stats['avg_position_diff'] = sum(abs(d) for d in stats['position_diffs']) / len(stats['position_diffs'])
-        
-        return stats
-    
-    def _get_accuracy_label(self, pos_diff):
-        """根據名次差獲取準確度標籤"""
-        if pos_diff is None:
-            return self.tr("N/A")
-        diff = abs(pos_diff)
-        if diff == 0:
-            return self.tr("完美")
-        elif diff <= 2:
-            return self.tr("良好")
-        else:
-            return self.tr("差")
     
     def _setup_accuracy_summary_tab(self, accuracy_stats):
         """創建準確度總結標籤頁，包含詳細統計"""
@@ -626,33 +761,18 @@ class RacePredictionModal(QDialog):
         perfect_pct = (accuracy_stats['perfect_predictions'] / total_horses * 100) if total_horses > 0 else 0.0
         good_pct = (accuracy_stats['good_predictions'] / total_horses * 100) if total_horses > 0 else 0.0
         
-        stats_text = self.tr("""
-        預測準確度總結
-        {sep}
-
-        總馬匹數: {total}
-        完美預測（準確名次）: {perfect} ({perfect_pct}%)
-        良好預測（相差2名以內）: {good} ({good_pct}%)
-        冠軍預測正確: {winner}
-        前三名準確度: {top3}/3 ({top3_pct}%)
-        平均名次差: {avg} 名
-
-        準確度分類:
-        • 完美: 完全預測到最終名次
-        • 良好: 預測名次與實際相差2名以內
-        • 差: 預測名次與實際相差3名或以上
-        """).format(
-            sep='='*50,
-            total=total_horses,
-            perfect=accuracy_stats['perfect_predictions'],
-            perfect_pct=f"{perfect_pct:.1f}",
-            good=accuracy_stats['good_predictions'],
-            good_pct=f"{good_pct:.1f}",
-            winner=self.tr('是') if accuracy_stats['winner_correct'] else self.tr('否'),
-            top3=accuracy_stats['top3_correct'],
-            top3_pct=f"{accuracy_stats['top3_correct']/3*100:.1f}" if accuracy_stats['top3_correct'] > 0 else "0.0",
-            avg=f"{accuracy_stats['avg_position_diff']:.2f}"
-        )
+        stats_text = self._stats_template.format_map({
+            'sep': '='*50,
+            'total': total_horses,
+            'perfect': accuracy_stats['perfect_predictions'],
+            'perfect_pct': f"{perfect_pct:.1f}",
+            'good': accuracy_stats['good_predictions'],
+            'good_pct': f"{good_pct:.1f}",
+            'winner': self.tr('是') if accuracy_stats['winner_correct'] else self.tr('否'),
+            'top3': accuracy_stats['top3_correct'],
+            'top3_pct': f"{accuracy_stats['top3_correct']/3*100:.1f}" if accuracy_stats['top3_correct'] > 0 else "0.0",
+            'avg': f"{accuracy_stats['avg_position_diff']:.2f}",
+        })
         
         stats_label = QLabel(stats_text)
         stats_label.setStyleSheet("""
@@ -15,6 +15,130 @@ from .icons import create_icon_widget
 from .race_overview import ProbabilityBar
 
 
+# The whole prediction modal style, set only on the PredictionModal root.
+# Widgets opt in through objectName selectors and the confLevel/edge/active
+# dynamic properties instead of carrying their own stylesheets.
+_MODAL_QSS = f"""
+    QDialog#predictionModal, QWidget#modalContent {{
+        background-color: {COLORS['background_primary']};
+    }}
+    DetailedHorseCard {{
+        background-color: {COLORS['background_secondary']};
+        border: 1px solid {COLORS['border_light']};
+        border-radius: 8px;
+    }}
+    QLabel#rankBadge {{
+        color: {COLORS['text_primary']};
+        font-size: 14px;
+        font-weight: bold;
+        background-color: {COLORS['background_tertiary']};
+        border-radius: 4px;
+        padding: 6px 12px;
+        min-width: 40px;
+        text-align: center;
+    }}
+    QLabel#horseName {{
+        color: {COLORS['text_primary']};
+        font-size: 16px;
+        font-weight: bold;
+    }}
+    QLabel#jockeyTrainer {{
+        color: {COLORS['text_secondary']};
+        font-size: 11px;
+    }}
+    QLabel#confidenceLabel {{
+        color: {COLORS['text_secondary']};
+        font-size: 12px;
+        font-weight: bold;
+    }}
+    QLabel#confidenceLabel[confLevel="High"] {{
+        color: {COLORS['accent_success']};
+    }}
+    QLabel#confidenceLabel[confLevel="Medium"] {{
+        color: {COLORS['accent_warning']};
+    }}
+    QLabel#confidenceLabel[confLevel="Low"] {{
+        color: {COLORS['accent_error']};
+    }}
+    QFrame#divider {{
+        background-color: {COLORS['border_light']};
+    }}
+    QLabel#statCaption {{
+        color: {COLORS['text_secondary']};
+        font-size: 10px;
+        text-transform: uppercase;
+    }}
+    QLabel#winProbValue, QLabel#oddsValue, QLabel#edgeValue {{
+        font-size: 24px;
+        font-weight: bold;
+    }}
+    QLabel#winProbValue, QLabel#edgeValue[edge="positive"] {{
+        color: {COLORS['accent_success']};
+    }}
+    QLabel#oddsValue {{
+        color: {COLORS['accent_primary']};
+    }}
+    QLabel#edgeValue[edge="negative"] {{
+        color: {COLORS['accent_error']};
+    }}
+    QLabel#detailValue {{
+        color: {COLORS['text_primary']};
+        font-size: 14px;
+        font-weight: bold;
+    }}
+    QLabel#modalTitle {{
+        color: {COLORS['text_primary']};
+    }}
+    QLabel#raceInfo {{
+        color: {COLORS['text_secondary']};
+        font-size: 12px;
+    }}
+    QPushButton#navButton, QPushButton#exportButton, QPushButton#closeButton {{
+        background-color: {COLORS['background_tertiary']};
+        color: {COLORS['text_primary']};
+        border: none;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-weight: 500;
+    }}
+    QPushButton#navButton[active="true"], QPushButton#closeButton {{
+        background-color: {COLORS['accent_primary']};
+    }}
+    QScrollArea#contentScroll {{
+        background-color: {COLORS['background_primary']};
+        border: none;
+    }}
+    QLabel#sectionTitle, QLabel#distributionTitle {{
+        color: {COLORS['text_primary']};
+        font-size: 14px;
+        font-weight: bold;
+        margin-bottom: 8px;
+    }}
+    QLabel#distributionTitle {{
+        font-size: 12px;
+    }}
+    QWidget#statTile, QWidget#statTile QLabel {{
+        background-color: {COLORS['background_secondary']};
+        border: 1px solid {COLORS['border_light']};
+        border-radius: 6px;
+    }}
+    QLabel#statValue {{
+        color: {COLORS['text_primary']};
+        font-size: 18px;
+        font-weight: bold;
+    }}
+"""
+
+
+def _set_active(button: QPushButton, active: bool):
+    """Switch a nav button's [active=...] QSS variant and re-polish it"""
+    if button.property("active") == active:
+        return
+    button.setProperty("active", active)
+    button.style().unpolish(button)
+    button.style().polish(button)
+
+
 class DetailedHorseCard(QWidget):
     """Detailed horse prediction card with comprehensive statistics"""
 
@@ -35,18 +159,7 @@ class DetailedHorseCard(QWidget):
 
         # Rank badge
         rank_badge = QLabel(f"#{self.rank}")
-        rank_badge.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: 14px;
-                font-weight: bold;
-                background-color: {COLORS['background_light']};
-                border-radius: 4px;
-                padding: 6px 12px;
-                min-width: 40px;
-                text-align: center;
-            }}
-        """)
+        rank_badge.setObjectName("rankBadge")
         rank_badge.setFixedWidth(50)
         header_layout.addWidget(rank_badge)
 
@@ -55,42 +168,20 @@ class DetailedHorseCard(QWidget):
         horse_info_layout.setSpacing(2)
 
         horse_name = QLabel(self.prediction['horse_name'])
-        horse_name.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: 16px;
-                font-weight: bold;
-            }}
-        """)
+        horse_name.setObjectName("horseName")
         horse_info_layout.addWidget(horse_name)
 
         jockey_trainer = QLabel(f"{self.prediction['jockey']} • {self.prediction['trainer']}")
-        jockey_trainer.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_secondary']};
-                font-size: 11px;
-            }}
-        """)
+        jockey_trainer.setObjectName("jockeyTrainer")
         horse_info_layout.addWidget(jockey_trainer)
 
         header_layout.addLayout(horse_info_layout)
 
         # Confidence badge
         confidence = self.prediction['confidence']
-        confidence_color = {
-            'High': COLORS['accent_green'],
-            'Medium': COLORS['accent_gold'],
-            'Low': COLORS['accent_red']
-        }.get(confidence, COLORS['text_secondary'])
-
         confidence_label = QLabel("{} {}".format(confidence, self.tr("Confidence")))
-        confidence_label.setStyleSheet(f"""
-            QLabel {{
-                color: {confidence_color};
-                font-size: 12px;
-                font-weight: bold;
-            }}
-        """)
+        confidence_label.setObjectName("confidenceLabel")
+        confidence_label.setProperty("confLevel", confidence)
         header_layout.addStretch()
         header_layout.addWidget(confidence_label)
 
@@ -99,7 +190,7 @@ class DetailedHorseCard(QWidget):
         # Divider
         divider = QFrame()
         divider.setFrameShape(QFrame.HLine)
-        divider.setStyleSheet(f"background-color: {COLORS['border']};")
+        divider.setObjectName("divider")
         layout.addWidget(divider)
 
         # Main stats grid
@@ -113,17 +204,11 @@ class DetailedHorseCard(QWidget):
         win_prob_layout.setSpacing(4)
 
         win_prob_label = QLabel(self.tr("Win Probability"))
-        win_prob_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 10px; text-transform: uppercase;")
+        win_prob_label.setObjectName("statCaption")
         win_prob_layout.addWidget(win_prob_label)
 
         win_prob_value = QLabel(f"{self.prediction['win_percentage']}")
-        win_prob_value.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['accent_green']};
-                font-size: 24px;
-                font-weight: bold;
-            }}
-        """)
+        win_prob_value.setObjectName("winProbValue")
         win_prob_layout.addWidget(win_prob_value)
 
         stats_layout.addWidget(win_prob_widget, 0, 0)
@@ -135,17 +220,11 @@ class DetailedHorseCard(QWidget):
         odds_layout.setSpacing(4)
 
         odds_label = QLabel(self.tr("Market Odds"))
-        odds_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 10px; text-transform: uppercase;")
+        odds_label.setObjectName("statCaption")
         odds_layout.addWidget(odds_label)
 
         odds_value = QLabel(f"{self.prediction['odds']:.1f}/1")
-        odds_value.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['accent_blue']};
-                font-size: 24px;
-                font-weight: bold;
-            }}
-        """)
+        odds_value.setObjectName("oddsValue")
         odds_layout.addWidget(odds_value)
 
         stats_layout.addWidget(odds_widget, 0, 1)
@@ -157,7 +236,7 @@ class DetailedHorseCard(QWidget):
         value_layout.setSpacing(4)
 
         value_label = QLabel(self.tr("Model Value"))
-        value_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 10px; text-transform: uppercase;")
+        value_label.setObjectName("statCaption")
         value_layout.addWidget(value_label)
 
         # Calculate implied probability from odds
@@ -165,15 +244,9 @@ class DetailedHorseCard(QWidget):
         model_prob = self.prediction['win_probability']
         edge = ((model_prob - implied_prob) / implied_prob * 100) if implied_prob > 0 else 0
 
-        value_color = COLORS['accent_green'] if edge > 0 else COLORS['accent_red']
         value_value = QLabel(f"{edge:+.1f}%")
-        value_value.setStyleSheet(f"""
-            QLabel {{
-                color: {value_color};
-                font-size: 24px;
-                font-weight: bold;
-            }}
-        """)
+        value_value.setObjectName("edgeValue")
+        value_value.setProperty("edge", "positive" if edge > 0 else "negative")
         value_layout.addWidget(value_value)
 
         stats_layout.addWidget(value_widget, 0, 2)
@@ -183,7 +256,7 @@ class DetailedHorseCard(QWidget):
         # Divider
         divider2 = QFrame()
         divider2.setFrameShape(QFrame.HLine)
-        divider2.setStyleSheet(f"background-color: {COLORS['border']};")
+        divider2.setObjectName("divider")
         layout.addWidget(divider2)
 
         # Details grid
@@ -210,15 +283,6 @@ class DetailedHorseCard(QWidget):
 
         layout.addLayout(details_layout)
 
-        # Styling
-        self.setStyleSheet(f"""
-            DetailedHorseCard {{
-                background-color: {COLORS['background_medium']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-            }}
-        """)
-
     def _create_detail_widget(self, label: str, value: str) -> QWidget:
         """Helper to create a detail label+value widget"""
         widget = QWidget()
@@ -227,11 +291,11 @@ class DetailedHorseCard(QWidget):
         layout.setSpacing(2)
 
         label_widget = QLabel(label)
-        label_widget.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 10px; text-transform: uppercase;")
+        label_widget.setObjectName("statCaption")
         layout.addWidget(label_widget)
 
         value_widget = QLabel(value)
-        value_widget.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 14px; font-weight: bold;")
+        value_widget.setObjectName("detailValue")
         layout.addWidget(value_widget)
 
         return widget
@@ -251,7 +315,8 @@ class PredictionModal(QDialog):
         self.setWindowTitle(self.tr("Race Predictions Analysis"))
         self.setMinimumSize(1200, 800)
         self.setMaximumSize(1600, 1000)
-        self.setStyleSheet(f"background-color: {COLORS['background_dark']};")
+        self.setObjectName("predictionModal")
+        self.setStyleSheet(_MODAL_QSS)
 
         self.init_ui()
 
@@ -265,12 +330,12 @@ class PredictionModal(QDialog):
 
         title = QLabel(self.tr("Race Prediction Analysis"))
         title.setFont(QFont("Arial", 18, QFont.Bold))
-        title.setStyleSheet(f"color: {COLORS['text_primary']};")
+        title.setObjectName("modalTitle")
         header_layout.addWidget(title)
 
         race_info_str = "{} • {}".format(self.race_info.get('date', self.tr('Unknown')), self.tr('Race {}').format(self.race_info.get('race_number', '?')))
         race_info_label = QLabel(race_info_str)
-        race_info_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 12px;")
+        race_info_label.setObjectName("raceInfo")
         header_layout.addStretch()
         header_layout.addWidget(race_info_label)
 
@@ -282,44 +347,17 @@ class PredictionModal(QDialog):
 
         self.view_all_btn = QPushButton(self.tr("All Predictions"))
         self.view_all_btn.clicked.connect(self.show_all_predictions)
-        self.view_all_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_primary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
+        self.view_all_btn.setObjectName("navButton")
         view_buttons_layout.addWidget(self.view_all_btn)
 
         self.view_top5_btn = QPushButton(self.tr("Top 5 Contenders"))
         self.view_top5_btn.clicked.connect(self.show_top_5)
-        self.view_top5_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_secondary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
+        self.view_top5_btn.setObjectName("navButton")
         view_buttons_layout.addWidget(self.view_top5_btn)
 
         self.view_stats_btn = QPushButton(self.tr("Statistical Summary"))
         self.view_stats_btn.clicked.connect(self.show_statistics)
-        self.view_stats_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_secondary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
+        self.view_stats_btn.setObjectName("navButton")
         view_buttons_layout.addWidget(self.view_stats_btn)
 
         view_buttons_layout.addStretch()
@@ -328,14 +366,10 @@ class PredictionModal(QDialog):
         # Main content area (scrollable)
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {COLORS['background_dark']};
-                border: none;
-            }}
-        """)
+        scroll_area.setObjectName("contentScroll")
 
         self.content_widget = QWidget()
+        self.content_widget.setObjectName("modalContent")
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(12)
@@ -348,32 +382,14 @@ class PredictionModal(QDialog):
 
         export_btn = QPushButton(self.tr("Export Analysis"))
         export_btn.clicked.connect(self.export_analysis)
-        export_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_secondary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
+        export_btn.setObjectName("exportButton")
         footer_layout.addWidget(export_btn)
 
         footer_layout.addStretch()
 
         close_btn = QPushButton(self.tr("Close"))
         close_btn.clicked.connect(self.accept)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_primary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
+        close_btn.setObjectName("closeButton")
         footer_layout.addWidget(close_btn)
 
         layout.addLayout(footer_layout)
@@ -386,14 +402,7 @@ class PredictionModal(QDialog):
         self.clear_content()
 
         title = QLabel(self.tr("All Horses - Ranked by Win Probability"))
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: 14px;
-                font-weight: bold;
-                margin-bottom: 8px;
-            }}
-        """)
+        title.setObjectName("sectionTitle")
         self.content_layout.addWidget(title)
 
         for rank, prediction in enumerate(self.predictions, 1):
@@ -402,50 +411,14 @@ class PredictionModal(QDialog):
             self.content_layout.addWidget(card)
 
         self.content_layout.addStretch()
-        self.view_all_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_primary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
-        self.view_top5_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_secondary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
-        self.view_stats_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_secondary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
+        self._set_active_view(self.view_all_btn)
 
     def show_top_5(self):
         """Show top 5 contenders only"""
         self.clear_content()
 
         title = QLabel(self.tr("Top 5 Contenders"))
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: 14px;
-                font-weight: bold;
-                margin-bottom: 8px;
-            }}
-        """)
+        title.setObjectName("sectionTitle")
         self.content_layout.addWidget(title)
 
         for rank, prediction in enumerate(self.predictions[:5], 1):
@@ -453,50 +426,14 @@ class PredictionModal(QDialog):
             self.content_layout.addWidget(card)
 
         self.content_layout.addStretch()
-        self.view_all_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_secondary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
-        self.view_top5_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_primary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
-        self.view_stats_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_secondary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
+        self._set_active_view(self.view_top5_btn)
 
     def show_statistics(self):
         """Show statistical summary and analysis"""
         self.clear_content()
 
         title = QLabel(self.tr("Statistical Summary"))
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: 14px;
-                font-weight: bold;
-                margin-bottom: 8px;
-            }}
-        """)
+        title.setObjectName("sectionTitle")
         self.content_layout.addWidget(title)
 
         # Calculate statistics
@@ -511,36 +448,12 @@ class PredictionModal(QDialog):
             self.content_layout.addWidget(self._create_distribution_view())
 
         self.content_layout.addStretch()
-        self.view_all_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_secondary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
-        self.view_top5_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_secondary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
-        self.view_stats_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['button_primary']};
-                color: {COLORS['text_primary']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 500;
-            }}
-        """)
+        self._set_active_view(self.view_stats_btn)
+
+    def _set_active_view(self, active_btn: QPushButton):
+        """Highlight the nav button of the view being shown"""
+        for btn in (self.view_all_btn, self.view_top5_btn, self.view_stats_btn):
+            _set_active(btn, btn is active_btn)
 
     def _create_statistics_widget(self, probs: list, odds: list) -> QWidget:
         """Create statistics display widget"""
@@ -563,26 +476,19 @@ class PredictionModal(QDialog):
 
         for idx, (label, value) in enumerate(stats):
             stat_widget = QWidget()
+            stat_widget.setObjectName("statTile")
             stat_layout = QVBoxLayout(stat_widget)
             stat_layout.setContentsMargins(12, 8, 12, 8)
             stat_layout.setSpacing(4)
 
             label_widget = QLabel(label)
-            label_widget.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 10px; text-transform: uppercase;")
+            label_widget.setObjectName("statCaption")
             stat_layout.addWidget(label_widget)
 
             value_widget = QLabel(value)
-            value_widget.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 18px; font-weight: bold;")
+            value_widget.setObjectName("statValue")
             stat_layout.addWidget(value_widget)
 
-            stat_widget.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {COLORS['background_medium']};
-                    border: 1px solid {COLORS['border']};
-                    border-radius: 6px;
-                }}
-            """)
-
             layout.addWidget(stat_widget, idx // 3, idx % 3)
 
         return widget
@@ -594,14 +500,7 @@ class PredictionModal(QDialog):
         layout.setContentsMargins(0, 12, 0, 0)
 
         title = QLabel(self.tr("Win Probability Distribution"))
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {COLORS['text_primary']};
-                font-size: 12px;
-                font-weight: bold;
-                margin-bottom: 8px;
-            }}
-        """)
+        title.setObjectName("distributionTitle")
         layout.addWidget(title)
 
         for rank, prediction in enumerate(self.predictions[:10], 1):
@@ -0,0 +1,18 @@
+"""
+Base class for QRunnables whose results come back through Qt signals.
+"""
+
+from PyQt5.QtCore import QObject, QRunnable
+
+
+class OwnedRunnable(QRunnable):
+    """QRunnable kept alive by the widget that starts it, not by the pool.
+
+    Auto-deletion is off so ``signals`` outlives run(); the owner holds a
+    reference until the result has been delivered.
+    """
+
+    def __init__(self, signals: QObject):
+        super().__init__()
+        self.signals = signals
+        self.setAutoDelete(False)
@@ -3,6 +3,10 @@ Modern PyQt6 Styling - Professional Betting Intelligence Terminal
 Clean, minimal, data-first design inspired by Bloomberg terminals
 """
 
+from functools import lru_cache
+
+from PyQt5.QtGui import QColor, QFont
+
 # Modern professional color scheme - light theme with subtle accents
 COLORS = {
     # Background colors
@@ -452,3 +456,26 @@ STATUS_INDICATOR_STYLE = f"""
         font-size: 12px;
     }}
 """
+
+
+# Dark table palette shared by the prediction dashboard and race modal,
+# parsed into QColors once instead of per cell
+TABLE_COLORS = {
+    'text': QColor("#f8fafc"),
+    'sub': QColor("#cbd5e1"),
+    'muted': QColor("#94a3b8"),
+    'dim': QColor("#64748b"),
+    'gray': QColor("#6b7280"),
+    'bg_row': QColor("#0f172a"),
+    'bg_alt': QColor("#1e293b"),
+    'green': QColor("#10b981"),
+    'blue': QColor("#3b82f6"),
+    'amber': QColor("#f59e0b"),
+    'red': QColor("#ef4444"),
+}
+
+
+@lru_cache(maxsize=None)
+def cached_font(point_size: int, weight: int = -1) -> QFont:
+    """Shared Arial fonts, built on first use (QFont needs a QApplication)"""
+    return QFont("Arial", point_size, weight)